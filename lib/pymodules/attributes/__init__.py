@@ -12,20 +12,12 @@ This module provides:
 - Integration with vitality for HP/SP/EP calculations
 - Integration with entities for racial attribute modifiers
 """
-import os
 import importlib
 import mudsys
 import mud
 
 mud.log_string("Attributes module: Starting initialization...")
 
-__all__ = []
-
-# Compile a list of all our modules
-for fl in os.listdir(__path__[0]):
-    if fl.endswith(".py") and not (fl == "__init__.py" or fl.startswith(".")):
-        __all__.append(fl[:-3])
-
 # Import all of our modules so they can register and initialize
 __all__ = ['attribute_data', 'attribute_aux', 'commands']
 
@@ -33,7 +25,6 @@ try:
     for module in __all__:
         mud.log_string(f"Attributes: Importing {module}...")
         importlib.import_module('.' + module, package=__name__)
-        mud.log_string(f"Attributes: {module} imported successfully")
     
     # Import the modules we need
     from . import attribute_aux
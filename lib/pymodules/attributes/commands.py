@@ -61,9 +61,10 @@ def cmd_stats(ch, cmd, arg):
         
         # Get regen rates
         position_mod = vitality_regen.get_position_modifier(ch)
-        hp_regen = vitality_regen.calculate_hp_regen_rate(ch) * position_mod
-        sp_regen = vitality_regen.calculate_sp_regen_rate(ch) * position_mod
-        ep_regen = vitality_regen.calculate_ep_regen_rate(ch) * position_mod
+        hp_rate, sp_rate, ep_rate = vitality_regen.calculate_regen_rates(ch)
+        hp_regen = hp_rate * position_mod
+        sp_regen = sp_rate * position_mod
+        ep_regen = ep_rate * position_mod
         
         lines.extend([
             "{c|{C                  Vitality Pools                        {c|{n",
@@ -8,6 +8,7 @@ REPLACE THE ENTIRE __init__.py WITH THIS VERSION
 
 import os
 import importlib
+from types import MappingProxyType
 import mud
 import auxiliary
 import storage
@@ -26,6 +27,7 @@ class SkillsAuxData:
     """Stores skill groups and character skill placement"""
     def __init__(self, set=None):
         self.groups = {}
+        self.skill_index = {}  # skill_name -> (placement, Skill)
         self.class_name = None
         if set:
             self.restore(set)
@@ -59,13 +61,16 @@ class ExperienceAuxData:
         # Manager will be recreated when needed
         pass
 
+# Shared read-only stand-in until a class provides real level definitions
+_NO_LEVEL_DEFINITIONS = MappingProxyType({})
+
 class LevelingAuxData:
     """Stores leveling progress and requirements"""
     def __init__(self, set=None):
         self.current_level = 1
         self.experience_points = 0
         self.class_name = 'Unknown'
-        self.level_definitions = {}
+        self.level_definitions = _NO_LEVEL_DEFINITIONS
         if set:
             self.restore(set)
     
@@ -110,7 +115,7 @@ __all__ = []
 # CRITICAL: tdp must come before experience (experience imports tdp)
 _modules = [
     'skills',        # Base skill definitions (no dependencies)
-    'tdp',           # TDP management (depends on attributes, but imported lazily)
+    'tdp',           # TDP management (imports attributes once at load)
     'experience',    # Experience pools (depends on skills, tdp)
     'leveling',      # Level progression (depends on skills)
     'integration',   # Main API (depends on all above)
@@ -152,6 +157,7 @@ from .skills import (
     get_skill,
     get_skill_rank,
     get_skill_rank_with_fraction,
+    get_rank_map,
     get_all_skills_for_character,
     get_skill_placement,
     lookup_skill_by_weapon_class,
@@ -183,10 +189,12 @@ from .integration import (
 
 from .tdp import (
     grant_tdp_for_skill_rank,
+    grant_tdp_for_skill_ranks,
     grant_tdp_for_level,
     get_available_tdp,
     get_spent_tdp,
     get_total_tdp,
+    flush_pending_tdp,
 )
 
 
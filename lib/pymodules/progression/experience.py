@@ -11,6 +11,8 @@ Uses your 8-attribute system for calculations.
 import time
 import math
 import mud
+from bisect import bisect_right
+from collections import deque
 from . import skills
 from . import tdp
 from . import yaml_parser
@@ -23,6 +25,71 @@ OFFLINE_DRAIN_RATE = 0.6  # 60% per 6 hours (full pool in 8 hours)
 # Pulse timing constants
 PULSE_TIME_BASELINE = 5 * 60  # 5 minutes in seconds
 PULSE_TIME_MINIMUM = 2 * 60   # 2 minutes minimum
+_NS_PER_S = 1_000_000_000
+
+# Deferred logging for heartbeat-path messages; drained by flush_log_queue()
+LOG_FLUSH_INTERVAL = 30  # seconds between log flushes
+LOG_QUEUE_LIMIT = 1024   # queued lines that force an early flush
+_LOG_QUEUE = deque()
+_last_log_flush_ns = 0
+
+# Pool status by fill percentage: <25 low, <50 medium, <75 high, <100 very high
+_POOL_THRESHOLDS = (25, 50, 75, 100)
+_POOL_STATUS_NAMES = ("low", "medium", "high", "very high", "mind lock")
+
+# Display separators (built once instead of on every command call)
+_HDR60 = "{c" + "=" * 60
+_HDR80 = "{c" + "=" * 80
+
+
+def queue_log(msg):
+    """Queue a log message to be written on the next flush"""
+    _LOG_QUEUE.append(msg)
+    if len(_LOG_QUEUE) >= LOG_QUEUE_LIMIT:
+        flush_log_queue(force=True)
+
+
+def flush_log_queue(force=False):
+    """
+    Write all queued log messages with a single mud.log_string call.
+    Only flushes once per LOG_FLUSH_INTERVAL unless force is set.
+    """
+    global _last_log_flush_ns
+    if not _LOG_QUEUE:
+        return
+    
+    now_ns = time.monotonic_ns()
+    if not force and now_ns - _last_log_flush_ns < LOG_FLUSH_INTERVAL * _NS_PER_S:
+        return
+    _last_log_flush_ns = now_ns
+    
+    batch = []
+    while _LOG_QUEUE:
+        batch.append(_LOG_QUEUE.popleft())
+    mud.log_string("\n".join(batch))
+
+
+def log_flush_hook(info):
+    """Heartbeat hook that periodically drains the deferred log queue"""
+    flush_log_queue()
+
+
+def log_shutdown_hook(info):
+    """Shutdown hook that writes everything still queued"""
+    flush_log_queue(force=True)
+
+
+def _find_due_groups(groups, now_ns, interval_ns):
+    """
+    Return the groups whose pulse timer has run for at least interval_ns.
+    Accepts a groups dict or a list of groups. Does a single integer compare
+    per group against a precomputed deadline.
+    """
+    if isinstance(groups, dict):
+        groups = groups.values()
+    deadline_ns = now_ns - interval_ns
+    return [group for group in groups
+            if group.last_pulse_time_ns is not None and group.last_pulse_time_ns <= deadline_ns]
 
 
 class ExperienceManager:
@@ -36,6 +103,20 @@ class ExperienceManager:
         self.last_login = time.time()
         self.last_logout = None
         self.last_offline_drain = time.time()
+        self._groups = None  # Cached reference to the skills aux groups dict
+    
+    def get_groups(self):
+        """
+        Get the character's skill groups.
+        The groups dict lives on the skills auxiliary and is cleared in place
+        on class setup, so the reference is looked up once and reused.
+        """
+        if self._groups is None:
+            skill_aux = self.ch.getAuxiliary("skills")
+            if skill_aux is None:
+                return {}
+            self._groups = skill_aux.groups
+        return self._groups
     
     def add_field_exp(self, skill_name, amount):
         """
@@ -49,19 +130,18 @@ class ExperienceManager:
         Returns:
             bool: True if successful
         """
-        skill = skills.get_skill(self.ch, skill_name)
-        if not skill:
+        for group in self.get_groups().values():
+            skill = group.add_field_exp(skill_name, amount)
+            if skill:
+                break
+        else:
             mud.log_string("ERROR: Skill '%s' not found for %s" % (skill_name, self.ch.name))
             return False
         
-        # Add field exp to skill's pool
-        skill.add_field_exp(amount)
         skill.last_trained = time.time()
         
         # Start pulse timer if not already running
-        group = skills.get_skill_registry().get_group_for_skill(skill_name)
-        if group and group.last_pulse_time is None:
-            group.last_pulse_time = time.time()
+        group.start_pulse_timer()
         
         return True
     
@@ -82,7 +162,7 @@ class ExperienceManager:
             int: Maximum bits that can be held in pool
         """
         rank = int(skill.rank)
-        placement = skill.skillset_placement
+        placement = skills.get_skill_placement(self.ch, skill.name)
         
         # Base pool sizes - function of rank
         # Formula: base_size = (rank_constant * rank) / (rank + placement_divisor) + base_offset
@@ -175,9 +255,18 @@ class ExperienceManager:
         Check if any skill groups should pulse and execute pulse if needed.
         Called from character heartbeat.
         """
-        groups = skills.get_skills(self.ch)
-        current_time = time.time()
-        pulse_time = self.calculate_pulse_time()
+        now_ns = time.monotonic_ns()
+        
+        # No group can be due before the minimum pulse time has elapsed, so
+        # most heartbeats stop here without reading any attributes
+        due = _find_due_groups(self.get_groups(), now_ns, PULSE_TIME_MINIMUM * _NS_PER_S)
+        if not due:
+            return
+        
+        pulse_time_ns = self.calculate_pulse_time() * _NS_PER_S
+        due = _find_due_groups(due, now_ns, pulse_time_ns)
+        if not due:
+            return
         
         # Get Wisdom modifier for pulse drain calculation
         try:
@@ -196,11 +285,10 @@ class ExperienceManager:
         wis_mod = max(0.0, (wis_value - 10) / 90.0)
         disc_mod = max(0.0, (disc_value - 10) / 90.0) * 0.1
         
-        for group in groups.values():
-            if group.should_pulse(current_time, pulse_time):
-                group.pulse(current_time, wis_mod + disc_mod)
-                mud.log_string("PULSE: %s's %s group pulsed (field exp -> ranks)" % 
-                             (self.ch.name, group.name))
+        for group in due:
+            group.pulse(now_ns, wis_mod + disc_mod)
+            queue_log("PULSE: %s's %s group pulsed (field exp -> ranks)" % 
+                      (self.ch.name, group.name))
     
     def check_offline_drain(self):
         """
@@ -224,23 +312,21 @@ class ExperienceManager:
         drain_multiplier = (OFFLINE_DRAIN_RATE) * (hours_over_delay / 6.0)
         drain_multiplier = min(drain_multiplier, 1.0)  # Cap at 100% drain
         
-        groups = skills.get_skills(self.ch)
+        groups = self.get_groups()
         
+        # Drain field exp at flat rate (not through normal pulse), then
+        # grant TDP for every rank-up in one go
+        rank_changes = []
         for group in groups.values():
-            for skill in group.get_all_skills():
-                if skill.field_exp > 0:
-                    # Drain field exp at flat rate (not through normal pulse)
-                    bits_to_drain = int(skill.field_exp * drain_multiplier)
-                    old_rank = skill.rank
-                    skill.convert_field_exp_to_rank(bits_to_drain)
-                    
-                    # Grant TDP if ranked up
-                    if skill.rank > old_rank:
-                        tdp.grant_tdp_for_skill_rank(self.ch, old_rank, skill.rank)
+            for skill, old_rank in group.drain_pending(drain_multiplier):
+                if skill.rank > old_rank:
+                    rank_changes.append((old_rank, skill.rank))
+        if rank_changes:
+            tdp.grant_tdp_for_skill_ranks(self.ch, rank_changes)
         
         self.last_offline_drain = current_time
-        mud.log_string("OFFLINE_DRAIN: %s drained %.1f%% experience pools after %.1f hours offline" % 
-                      (self.ch.name, drain_multiplier * 100, hours_over_delay))
+        queue_log("OFFLINE_DRAIN: %s drained %.1f%% experience pools after %.1f hours offline" % 
+                  (self.ch.name, drain_multiplier * 100, hours_over_delay))
     
     def on_login(self):
         """Called when character logs in"""
@@ -320,23 +406,12 @@ def get_pool_status(ch, skill_name):
         return "unknown"
     
     max_pool = manager.calculate_pool_size(skill)
-    if max_pool <= 0:
+    if max_pool <= 0 or skill.field_exp <= 0:
         return "clear"
     
-    percentage = (skill.field_exp / max_pool) * 100
-    
-    if percentage == 0:
-        return "clear"
-    elif percentage < 25:
-        return "low"
-    elif percentage < 50:
-        return "medium"
-    elif percentage < 75:
-        return "high"
-    elif percentage < 100:
-        return "very high"
-    else:
-        return "mind lock"
+    # Floor division keeps the threshold compares exact without a float divide
+    percentage = (skill.field_exp * 100) // max_pool
+    return _POOL_STATUS_NAMES[bisect_right(_POOL_THRESHOLDS, percentage)]
 
 
 # Debug/admin commands
@@ -346,8 +421,8 @@ def cmd_exp(ch, cmd, arg):
     Usage: exp [skill_name]
     Display experience pools and learning progress.
     """
-    groups = skills.get_skills(ch)
     manager = get_experience_manager(ch)
+    groups = manager.get_groups() if manager else None
     
     if not groups or not manager:
         ch.send("Experience system not initialized.")
@@ -355,7 +430,7 @@ def cmd_exp(ch, cmd, arg):
     
     if arg and arg.strip():
         # Show specific skill
-        skill_name = arg.strip()
+        skill_name = skills.get_skill_registry().resolve_skill_name(arg) or arg.strip()
         skill = skills.get_skill(ch, skill_name)
         if not skill:
             ch.send("Skill '%s' not found." % skill_name)
@@ -365,32 +440,35 @@ def cmd_exp(ch, cmd, arg):
         status = get_pool_status(ch, skill_name)
         bits_to_next = skill.get_bits_to_next_rank()
         
-        ch.send("{c" + "=" * 60)
-        ch.send("{c%s{n" % skill.name)
-        ch.send("{c" + "=" * 60)
-        ch.send("{wRank:           {y%.2f{n" % skill.rank)
-        ch.send("{wField Exp:      {y%d / %d bits{n (%s)" % (skill.field_exp, max_pool, status))
-        ch.send("{wBits to next:   {y%d{n" % bits_to_next)
-        ch.send("{wProgress:       {y%.1f%%{n" % ((skill.field_exp / bits_to_next) * 100))
-        ch.send("{c" + "=" * 60)
+        ch.send("\r\n".join([
+            _HDR60,
+            "{c%s{n" % skill.name,
+            _HDR60,
+            "{wRank:           {y%.2f{n" % skill.rank,
+            "{wField Exp:      {y%d / %d bits{n (%s)" % (skill.field_exp, max_pool, status),
+            "{wBits to next:   {y%d{n" % bits_to_next,
+            "{wProgress:       {y%.1f%%{n" % ((skill.field_exp / bits_to_next) * 100),
+            _HDR60,
+        ]))
         return
     
     # Show all skills grouped
-    ch.send("{c" + "=" * 80)
-    ch.send("{c%-30s %-8s %-15s %-20s{n" % ("Skill", "Rank", "Pool Status", "Group"))
-    ch.send("{c" + "=" * 80)
+    buf = [_HDR80,
+           "{c%-30s %-8s %-15s %-20s{n" % ("Skill", "Rank", "Pool Status", "Group"),
+           _HDR80]
     
     for group_name, group in sorted(groups.items()):
         for skill in sorted(group.get_all_skills(), key=lambda s: s.name):
             status = get_pool_status(ch, skill.name)
-            ch.send("{w%-30s {y%7.2f  {g%-15s {b%-20s{n" % 
-                   (skill.name[:29], skill.rank, status, group_name))
+            buf.append("{w%-30s {y%7.2f  {g%-15s {b%-20s{n" % 
+                       (skill.name[:29], skill.rank, status, group_name))
     
-    ch.send("{c" + "=" * 80)
+    buf.append(_HDR80)
     
     # Show pulse time
     pulse_time = manager.calculate_pulse_time()
-    ch.send("{wPulse Interval: {y%.1f minutes{n" % (pulse_time / 60.0))
+    buf.append("{wPulse Interval: {y%.1f minutes{n" % (pulse_time / 60.0))
+    ch.send("\r\n".join(buf))
 
 
 def cmd_add_exp(ch, cmd, arg):
@@ -404,6 +482,7 @@ def cmd_add_exp(ch, cmd, arg):
         return
     
     skill_name = " ".join(args[:-1])  # Handle multi-word skill names
+    skill_name = skills.get_skill_registry().resolve_skill_name(skill_name) or skill_name
     try:
         amount = int(args[-1])
     except ValueError:
@@ -413,7 +492,7 @@ def cmd_add_exp(ch, cmd, arg):
     if add_skill_exp(ch, skill_name, amount, "admin_command"):
         ch.send("Added %d bits to %s" % (amount, skill_name))
         mud.log_string("ADMIN: %s added %d bits to %s's %s" % 
-                      (ch.name, amount, ch.name, skill_name))
+                       (ch.name, amount, ch.name, skill_name))
     else:
         ch.send("Failed to add experience.")
 
@@ -421,6 +500,11 @@ def cmd_add_exp(ch, cmd, arg):
 def register_experience_commands():
     """Register experience commands"""
     import mudsys
+    import hooks
     mudsys.add_cmd("exp", None, cmd_exp, "player", False)
     mudsys.add_cmd("add_exp", None, cmd_add_exp, "admin", False)
+    hooks.add("heartbeat", tdp.tdp_flush_hook)
+    hooks.add("shutdown", tdp.tdp_flush_hook)
+    hooks.add("heartbeat", log_flush_hook)
+    hooks.add("shutdown", log_shutdown_hook)
     mud.log_string("Experience commands registered")
\ No newline at end of file
@@ -11,11 +11,16 @@ import hooks
 from . import skills as progression_skills
 from . import experience as progression_experience
 from . import leveling as progression_leveling
+from . import tdp as progression_tdp
 from . import yaml_parser
 
 # Configuration
 OFFLINE_DRAIN_DELAY = 8 * 60 * 60  # 8 hours before offline drain starts
 
+# Display separators (built once instead of on every command call)
+_HDR78 = "{c" + "=" * 78
+_STAR78 = "{c" + "*" * 78
+
 
 def setup_progression(ch, class_config):
     """
@@ -121,8 +126,6 @@ def on_skill_rank_gained(ch, skill_name, old_rank, new_rank):
         new_rank: New rank
     """
     try:
-        from . import tdp as progression_tdp
-        
         # Grant TDP for skill rank advancement
         tdp_gained = progression_tdp.grant_tdp_for_skill_rank(ch, old_rank, new_rank)
         
@@ -132,8 +135,8 @@ def on_skill_rank_gained(ch, skill_name, old_rank, new_rank):
         # Check if this triggers a level up
         progression_leveling.check_level_up(ch)
         
-        mud.log_string("SKILL_UP: %s's %s ranked up (%.2f -> %.2f, +%d TDP)" % 
-                      (ch.name, skill_name, old_rank, new_rank, tdp_gained))
+        progression_experience.queue_log("SKILL_UP: %s's %s ranked up (%.2f -> %.2f, +%d TDP)" % 
+                                         (ch.name, skill_name, old_rank, new_rank, tdp_gained))
     
     except Exception as e:
         mud.log_string("ERROR: on_skill_rank_gained failed for %s: %s" % (ch.name, str(e)))
@@ -219,30 +222,33 @@ def cmd_skills(ch, cmd, arg):
     """
     arg = arg.strip().lower()
     registry = progression_skills.get_skill_registry()
+    category = registry.resolve_category(arg) if arg else None
     
     # Check if showing specific skill details
-    if arg and arg not in ['all'] and arg not in [cat.lower() for cat in progression_skills.get_all_categories()]:
+    if arg and arg != 'all' and not category:
         # Try as specific skill name
-        skill = progression_skills.get_skill(ch, arg)
+        skill_name = registry.resolve_skill_name(arg) or arg
+        skill = progression_skills.get_skill(ch, skill_name)
         if skill:
             skill_info = registry.get_skill_info(skill.name)
             rank_int = int(skill.rank)
             percentage = skill.get_percentage_to_next_rank()
             bits_to_next = skill.get_bits_to_next_rank()
             
-            ch.send("{c" + "=" * 78)
-            ch.send("{c%s{n" % skill.name)
-            ch.send("{c" + "=" * 78)
-            ch.send("{wRank:{n %d.%02d" % (rank_int, percentage))
-            ch.send("{wProgress:{n %d / %d bits" % (skill.field_exp, bits_to_next))
+            buf = [_HDR78,
+                   "{c%s{n" % skill.name,
+                   _HDR78,
+                   "{wRank:{n %d.%02d" % (rank_int, percentage),
+                   "{wProgress:{n %d / %d bits" % (skill.field_exp, bits_to_next)]
             
             if skill_info:
-                ch.send("{wCategory:{n %s" % skill_info.get('category', 'Unknown'))
+                buf.append("{wCategory:{n %s" % skill_info.get('category', 'Unknown'))
                 desc = skill_info.get('description', '')
                 if desc:
-                    ch.send("{wDescription:{n %s" % desc)
+                    buf.append("{wDescription:{n %s" % desc)
             
-            ch.send("{c" + "=" * 78)
+            buf.append(_HDR78)
+            ch.send("\r\n".join(buf))
             return
         else:
             # Not a skill name or category
@@ -251,37 +257,23 @@ def cmd_skills(ch, cmd, arg):
     
     # Show all categories or specific category
     if arg == 'all':
-        # Show all skills
+        # Show all skills, using the shared 0-progress template for missing ones
         by_category = {}
-        for skill_name in registry.list_all_skills():
-            skill_info = registry.get_skill_info(skill_name)
-            category = skill_info.get('category', 'Miscellaneous')
-            
-            if category not in by_category:
-                by_category[category] = []
-            
-            char_skill = progression_skills.get_skill(ch, skill_name)
-            if char_skill:
-                by_category[category].append(char_skill)
-            else:
-                # Add skill with 0 progress
-                new_skill = progression_skills.Skill(skill_name)
-                by_category[category].append(new_skill)
-    elif arg and arg in [cat.lower() for cat in progression_skills.get_all_categories()]:
+        char_skills = progression_skills.get_all_skills_for_character(ch)
+        templates = registry.skill_templates
+        for skill_name, skill_category in registry.skill_categories.items():
+            if skill_category not in by_category:
+                by_category[skill_category] = []
+            by_category[skill_category].append(char_skills.get(skill_name) or templates[skill_name])
+    elif category:
         # Show specific category (all skills in it)
-        actual_category = None
-        for cat in progression_skills.get_all_categories():
-            if cat.lower() == arg:
-                actual_category = cat
-                break
-        
-        by_category = {actual_category: progression_skills.get_skills_by_category(ch, actual_category, all_skills=True)}
+        by_category = {category: progression_skills.get_skills_by_category(ch, category, all_skills=True)}
     else:
         # Show only skills with progress
         by_category = progression_skills.get_skills_with_progress(ch)
     
     # Display the skills
-    ch.send("{c" + "*" * 78)
+    buf = [_STAR78]
     
     total_ranks = 0
     for category in sorted(by_category.keys()):
@@ -290,7 +282,7 @@ def cmd_skills(ch, cmd, arg):
         if not skills_list:
             continue
         
-        ch.send("{c%s{n" % category.upper())
+        buf.append("{c%s{n" % category.upper())
         
         # Sort skills in this category alphabetically
         skills_list.sort(key=lambda s: s.name)
@@ -302,9 +294,8 @@ def cmd_skills(ch, cmd, arg):
             percent1 = skill1.get_percentage_to_next_rank()
             total_ranks += rank1_int
             
-            # Left column: skill name padded to 35 chars, then rank.percent
-            left_name = skill1.name[:33].ljust(33)
-            left_col = " {w%s{n {y%d.%02d{n" % (left_name, rank1_int, percent1)
+            # Left column: skill name cut/padded to 33 chars, then rank.percent
+            left_col = " {w%-33.33s{n {y%d.%02d{n" % (skill1.name, rank1_int, percent1)
             
             if i + 1 < len(skills_list):
                 skill2 = skills_list[i + 1]
@@ -312,18 +303,17 @@ def cmd_skills(ch, cmd, arg):
                 percent2 = skill2.get_percentage_to_next_rank()
                 total_ranks += rank2_int
                 
-                # Right column: skill name padded to 35 chars, then rank.percent
-                right_name = skill2.name[:33].ljust(33)
-                right_col = " {w%s{n {y%d.%02d{n" % (right_name, rank2_int, percent2)
+                # Right column: skill name cut/padded to 33 chars, then rank.percent
+                right_col = " {w%-33.33s{n {y%d.%02d{n" % (skill2.name, rank2_int, percent2)
                 
-                ch.send(left_col + right_col)
+                buf.append(left_col + right_col)
             else:
-                ch.send(left_col)
+                buf.append(left_col)
         
-        ch.send("")
+        buf.append("")
     
     # Footer
-    ch.send("{c" + "*" * 78)
+    buf.append(_STAR78)
     
     # Get level and class from leveling system
     try:
@@ -345,11 +335,10 @@ def cmd_skills(ch, cmd, arg):
     except:
         tdp = 0
     
-    footer = "|Total Ranks: %-45d TDPs: %-11d|" % (total_ranks, tdp)
-    ch.send(footer)
-    footer2 = "|Level: %d %s * Favors: None%-45s|" % (current_level, class_name, "")
-    ch.send(footer2)
-    ch.send("{c" + "*" * 78)
+    buf.append("|Total Ranks: %-45d TDPs: %-11d|" % (total_ranks, tdp))
+    buf.append("|Level: %d %s * Favors: None%-45s|" % (current_level, class_name, ""))
+    buf.append(_STAR78)
+    ch.send("\r\n".join(buf))
 
 
 def cmd_init_progression(ch, cmd, arg):
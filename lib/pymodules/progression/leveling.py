@@ -8,8 +8,11 @@ Old approach: Single global levels.yaml with requirements for all
 New approach: Each class has its own level requirements in class config
 """
 
+import copy
+import sys
 import mud
 from . import skills
+from . import tdp
 from . import yaml_parser
 
 # Level constants
@@ -20,8 +23,10 @@ LEVEL_MAX = 250
 class LevelRequirement:
     """Represents a single skill requirement for a level"""
     
+    __slots__ = ('skill_name', 'required_rank', 'count_type')
+    
     def __init__(self, skill_name, required_rank, count_type="any"):
-        self.skill_name = skill_name
+        self.skill_name = sys.intern(skill_name)
         self.required_rank = required_rank
         self.count_type = count_type  # "any" = counts toward total, "bonus" = doesn't count
     
@@ -33,6 +38,8 @@ class LevelRequirement:
 class LevelDefinition:
     """Represents a single level with all its skill requirements"""
     
+    __slots__ = ('level', 'requirements', 'total_required_ranks', 'tdp_reward')
+    
     def __init__(self, level_number):
         self.level = level_number
         self.requirements = []
@@ -50,31 +57,52 @@ class LevelDefinition:
         """Set TDP reward for this level"""
         self.tdp_reward = tdp_amount
     
-    def check_met(self, ch):
+    def check_met(self, ch, rank_map=None):
         """
         Check if character meets all requirements for this level.
         
+        Args:
+            ch: Character
+            rank_map: Optional {skill_name: rank} from skills.get_rank_map()
+        
         Returns:
             tuple: (is_met: bool, unmet_skills: list of (skill_name, required, actual))
         """
+        if rank_map is None:
+            rank_map = skills.get_rank_map(ch)
         unmet = []
         
         for req in self.requirements:
-            actual_rank = skills.get_skill_rank(ch, req.skill_name)
+            actual_rank = rank_map.get(req.skill_name, 0)
             
             if not req.is_met(actual_rank):
                 unmet.append((req.skill_name, req.required_rank, actual_rank))
         
         return (len(unmet) == 0, unmet)
     
-    def get_progress(self, ch):
+    def is_met_fast(self, rank_map):
+        """
+        Boolean-only requirement check that stops at the first unmet skill.
+        Use check_met() when the list of unmet requirements is needed.
+        
+        Args:
+            rank_map: {skill_name: rank} from skills.get_rank_map()
+        """
+        for req in self.requirements:
+            if rank_map.get(req.skill_name, 0) < req.required_rank:
+                return False
+        return True
+    
+    def get_progress(self, ch, rank_map=None):
         """Get progress toward this level as a percentage"""
         if not self.requirements:
             return 100.0
         
+        if rank_map is None:
+            rank_map = skills.get_rank_map(ch)
         met_ranks = 0
         for req in self.requirements:
-            actual_rank = skills.get_skill_rank(ch, req.skill_name)
+            actual_rank = rank_map.get(req.skill_name, 0)
             met_ranks += min(actual_rank, req.required_rank)
         
         if self.total_required_ranks <= 0:
@@ -82,6 +110,31 @@ class LevelDefinition:
         
         return (met_ranks / self.total_required_ranks) * 100.0
     
+    def progress_and_unmet(self, rank_map):
+        """
+        Single pass computing both get_progress() and check_met()'s unmet list.
+        
+        Args:
+            rank_map: {skill_name: rank} from skills.get_rank_map()
+        
+        Returns:
+            tuple: (progress_pct: float, unmet_skills: list of (skill_name, required, actual))
+        """
+        unmet = []
+        met_ranks = 0
+        for req in self.requirements:
+            actual_rank = rank_map.get(req.skill_name, 0)
+            required = req.required_rank
+            if actual_rank < required:
+                unmet.append((req.skill_name, required, actual_rank))
+                met_ranks += actual_rank
+            else:
+                met_ranks += required
+        
+        if not self.requirements or self.total_required_ranks <= 0:
+            return (100.0, unmet)
+        return ((met_ranks / self.total_required_ranks) * 100.0, unmet)
+    
     def to_dict(self):
         """Serialize to dictionary"""
         return {
@@ -109,28 +162,28 @@ class LevelDefinition:
             )
 
 
-def setup_leveling_from_class_config(ch, class_config):
+# class_name -> (levels config it was built from, {level_num: LevelDefinition})
+_CLASS_LEVEL_DEFS = {}
+
+
+def _get_class_level_template(class_config):
     """
-    Initialize leveling system for a character based on their class config.
-    Called AFTER the class is chosen for the character.
+    Get the level definitions for a class config, building them once per class.
+    Different configs can share a class_name (the ad-hoc 'Novice' setups), and a
+    reloaded class YAML changes the section, so a cached template is only reused
+    while its levels section is still equal to the one passed in.
     
-    Args:
-        ch: Character to initialize
-        class_config: Loaded class YAML config (dict)
+    Returns:
+        dict: {level_num: LevelDefinition}
     """
-    level_aux = ch.getAuxiliary("leveling")
-    
-    if level_aux is None:
-        level_aux = ch.createAuxiliary("leveling")
-    
-    level_aux.current_level = LEVEL_MIN
-    level_aux.experience_points = 0
-    level_aux.class_name = class_config.get('class_name', 'Unknown')
-    
-    # Build level definitions from class config
-    level_aux.level_definitions = {}
+    class_name = class_config.get('class_name', 'Unknown')
     levels_config = class_config.get('levels', {})
     
+    cached = _CLASS_LEVEL_DEFS.get(class_name)
+    if cached is not None and cached[0] == levels_config:
+        return cached[1]
+    
+    level_definitions = {}
     for level_num_str, level_data in levels_config.items():
         try:
             level_num = int(level_num_str)
@@ -150,7 +203,34 @@ def setup_leveling_from_class_config(ch, class_config):
                 req_data.get('count_type', 'any')
             )
         
-        level_aux.level_definitions[level_num] = level_def
+        level_definitions[level_num] = level_def
+    
+    # Keep our own copy so later edits to the caller's dict can't match it
+    _CLASS_LEVEL_DEFS[class_name] = (copy.deepcopy(levels_config), level_definitions)
+    return level_definitions
+
+
+def setup_leveling_from_class_config(ch, class_config):
+    """
+    Initialize leveling system for a character based on their class config.
+    Called AFTER the class is chosen for the character.
+    
+    Args:
+        ch: Character to initialize
+        class_config: Loaded class YAML config (dict)
+    """
+    level_aux = ch.getAuxiliary("leveling")
+    
+    if level_aux is None:
+        level_aux = ch.createAuxiliary("leveling")
+    
+    level_aux.current_level = LEVEL_MIN
+    level_aux.experience_points = 0
+    level_aux.class_name = class_config.get('class_name', 'Unknown')
+    
+    # Level definitions are shared by every character of the class and are
+    # read-only; copy the dict before making any per-character change
+    level_aux.level_definitions = _get_class_level_template(class_config)
     
     mud.log_string("LEVELING: Initialized %d level tiers for %s (class: %s)" % 
                   (len(level_aux.level_definitions), ch.name, class_config.get('class_name')))
@@ -171,7 +251,7 @@ def setup_leveling(ch):
         level_aux.current_level = LEVEL_MIN
         level_aux.experience_points = 0
         level_aux.class_name = "Unclassed"
-        level_aux.level_definitions = {}
+        # level_definitions stays the aux's shared empty mapping until a class is chosen
         mud.log_string("LEVELING: Initialized leveling system for %s" % ch.name)
 
 
@@ -202,31 +282,41 @@ def get_level_definition(ch, level_num):
     return level_aux.level_definitions.get(level_num)
 
 
-def check_level_up(ch):
+def check_level_up(ch, rank_map=None):
     """
     Check if character should advance to next level.
+    Advances through as many levels as the character qualifies for.
     Called periodically (e.g., on skill rank up).
     
+    Args:
+        ch: Character
+        rank_map: Optional {skill_name: rank} from skills.get_rank_map()
+    
     Returns:
         bool: True if character leveled up
     """
-    current_level = get_current_level(ch)
-    next_level_num = current_level + 1
-    
-    if next_level_num > LEVEL_MAX:
-        return False
-    
-    next_level_def = get_level_definition(ch, next_level_num)
-    
-    if not next_level_def:
+    level_aux = ch.getAuxiliary("leveling")
+    if not level_aux or not hasattr(level_aux, 'level_definitions'):
         return False
     
-    is_met, unmet_skills = next_level_def.check_met(ch)
+    level_defs = level_aux.level_definitions
+    leveled = False
     
-    if is_met:
-        level_aux = ch.getAuxiliary("leveling")
+    while level_aux.current_level < LEVEL_MAX:
+        next_level_num = level_aux.current_level + 1
+        next_level_def = level_defs.get(next_level_num)
+        if not next_level_def:
+            break
+        
+        # Ranks don't change while leveling, so one snapshot covers every level
+        if rank_map is None:
+            rank_map = skills.get_rank_map(ch)
+        if not next_level_def.is_met_fast(rank_map):
+            break
+        
         old_level = level_aux.current_level
         level_aux.current_level = next_level_num
+        leveled = True
         
         mud.log_string("LEVEL_UP: %s advanced from level %d to %d" % 
                       (ch.name, old_level, next_level_num))
@@ -236,22 +326,10 @@ def check_level_up(ch):
         
         # Grant TDP for level (class-specific amount)
         tdp_reward = next_level_def.tdp_reward
-        if tdp_reward > 0:
-            try:
-                from . import attribute_aux
-                attr_aux = attribute_aux.get_attributes(ch)
-                if attr_aux:
-                    attr_aux.add_tdp(tdp_reward)
-                    ch.send("{g*** You gained %d TDP from reaching level %d! ***{n\n" % (tdp_reward, next_level_num))
-            except ImportError:
-                pass
-        
-        # Recursively check if they can advance further
-        check_level_up(ch)
-        
-        return True
+        if tdp_reward > 0 and tdp.grant_tdp_for_level(ch, next_level_num, tdp_reward):
+            ch.send("{g*** You gained %d TDP from reaching level %d! ***{n\n" % (tdp_reward, next_level_num))
     
-    return False
+    return leveled
 
 
 def get_next_level_progress(ch):
@@ -269,10 +347,7 @@ def get_next_level_progress(ch):
     if not next_level_def:
         return (100.0, [])
     
-    progress = next_level_def.get_progress(ch)
-    _, unmet = next_level_def.check_met(ch)
-    
-    return (progress, unmet)
+    return next_level_def.progress_and_unmet(skills.get_rank_map(ch))
 
 
 # Debug/admin commands
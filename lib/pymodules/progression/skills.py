@@ -13,17 +13,61 @@ New approach: Placement defined per-class in class YAML config
 """
 
 from . import yaml_parser as yaml
+import copy
 import mud
+import math
 import os
+import sys
+import time
 
 
 CONFIG_DIR = "./config"
 SKILLS_CONFIG = os.path.join(CONFIG_DIR, "skills.yaml")
 
+# Log every successful skill config load (init_progression already logs the count)
+DEBUG_SKILL_LOAD = False
+
 # Skill rank constants
 SKILL_MIN_RANK = 0
 SKILL_MAX_RANK = 3000
 
+# Bits needed to go from rank n to n+1, and total bits to reach rank n
+_BITS_TO_NEXT = tuple(range(200, 200 + SKILL_MAX_RANK + 1))
+_CUM_BITS = tuple(200 * n + (n * (n - 1)) // 2 for n in range(SKILL_MAX_RANK + 1))
+
+# Fraction of each skill's pool drained per pulse, by placement
+_BASE_DRAIN_RATES = {
+    "primary": 0.05,
+    "secondary": 0.04,
+    "tertiary": 0.03,
+    "else": 0.02,
+}
+
+# Pulse decisions use integer monotonic nanoseconds
+_NS_PER_S = 1_000_000_000
+
+
+def _advance_rank(rank, bits):
+    """
+    Apply bits of experience to a rank and return the new rank.
+    Pure arithmetic core of Skill.convert_field_exp_to_rank.
+    """
+    # Whole ranks gained is the largest k with
+    #   sum(200 + start_rank + i for i in range(k)) <= bits
+    # which solves to (2k + a)^2 <= a^2 + 8 * bits with a = 399 + 2 * start_rank
+    start_rank = int(rank)
+    a = 399 + 2 * start_rank
+    ranks_gained = (math.isqrt(a * a + 8 * int(bits)) - a) // 2
+    remaining_bits = bits - (ranks_gained * (200 + start_rank) +
+                             (ranks_gained * (ranks_gained - 1)) // 2)
+    
+    rank += ranks_gained
+    if rank >= SKILL_MAX_RANK:
+        return SKILL_MAX_RANK
+    
+    # Leftover bits become the fractional part
+    return min(rank + remaining_bits / _BITS_TO_NEXT[int(rank)], SKILL_MAX_RANK)
+
 
 class Skill:
     """
@@ -31,8 +75,10 @@ class Skill:
     NOTE: Placement is NOT stored here - it's determined by character's class
     """
     
+    __slots__ = ('name', 'rank', 'field_exp', 'last_trained')
+    
     def __init__(self, name):
-        self.name = name
+        self.name = sys.intern(name)
         self.rank = 0.0  # Double with 2 significant digits (e.g., 12.31)
         self.field_exp = 0  # Raw bits in field exp pool
         self.last_trained = None  # Timestamp of last training
@@ -42,15 +88,15 @@ class Skill:
         Calculate bits needed to reach next rank.
         Formula: 200 + current_rank
         """
-        current_rank = int(self.rank)
-        return 200 + current_rank
+        return _BITS_TO_NEXT[int(self.rank)]
     
     def get_total_bits_to_rank(self, target_rank):
         """Calculate total bits from rank 0 to target_rank"""
-        total = 0
-        for n in range(target_rank):
-            total += 200 + n
-        return total
+        if target_rank <= 0:
+            return 0
+        if target_rank <= SKILL_MAX_RANK:
+            return _CUM_BITS[target_rank]
+        return 200 * target_rank + (target_rank * (target_rank - 1)) // 2
     
     def add_field_exp(self, bits):
         """Add bits to field experience pool"""
@@ -64,32 +110,13 @@ class Skill:
         bits_converted = min(bits_to_convert, self.field_exp)
         self.field_exp -= bits_converted
         
-        remaining_bits = bits_converted
-        ranks_gained = 0
-        current_test_rank = int(self.rank)
-        
-        while remaining_bits >= self.get_bits_to_next_rank():
-            bits_needed = 200 + current_test_rank
-            remaining_bits -= bits_needed
-            ranks_gained += 1
-            current_test_rank += 1
-        
-        self.rank += ranks_gained
-        
-        bits_to_next = 200 + int(self.rank)
-        if bits_to_next > 0:
-            self.rank += remaining_bits / bits_to_next
-        
-        self.rank = min(self.rank, SKILL_MAX_RANK)
+        self.rank = _advance_rank(self.rank, bits_converted)
         
         return bits_converted
     
     def get_percentage_to_next_rank(self):
         """Get field exp as percentage toward next rank"""
-        bits_to_next = self.get_bits_to_next_rank()
-        if bits_to_next <= 0:
-            return 0
-        return int((self.field_exp / bits_to_next) * 100)
+        return int((self.field_exp / _BITS_TO_NEXT[int(self.rank)]) * 100)
     
     def to_dict(self):
         """Serialize to dictionary"""
@@ -102,7 +129,7 @@ class Skill:
     
     def from_dict(self, data):
         """Deserialize from dictionary"""
-        self.name = data.get("name", self.name)
+        self.name = sys.intern(data.get("name", self.name))
         self.rank = data.get("rank", 0.0)
         self.field_exp = data.get("field_exp", 0)
         self.last_trained = data.get("last_trained")
@@ -118,7 +145,9 @@ class SkillGroup:
         self.name = name
         self.skillset_placement = skillset_placement  # primary, secondary, tertiary, else
         self.skills = {}  # skill_name -> Skill object
-        self.last_pulse_time = None
+        self.pending = {}  # skill_name -> Skill for skills holding field exp
+        self.last_pulse_time = None  # Wall-clock time of last pulse (display/saving)
+        self.last_pulse_time_ns = None  # Monotonic time of last pulse (drives pulsing)
         self.pulse_interval = 5 * 60  # Configurable per group (default 5 min)
     
     def add_skill(self, skill_name):
@@ -132,43 +161,80 @@ class SkillGroup:
         """Get skill by name"""
         return self.skills.get(skill_name)
     
+    def add_field_exp(self, skill_name, bits):
+        """
+        Add field exp to a skill in this group and track it as pending.
+        
+        Returns:
+            Skill or None: The skill trained, if it is in this group
+        """
+        skill = self.skills.get(skill_name)
+        if skill is None:
+            return None
+        skill.add_field_exp(bits)
+        if skill.field_exp > 0:
+            self.pending[skill_name] = skill
+        else:
+            self.pending.pop(skill_name, None)
+        return skill
+    
+    def drain_pending(self, fraction):
+        """
+        Convert a fraction of every pending skill's field exp to ranks.
+        Only skills holding field exp are visited.
+        
+        Returns:
+            list: (skill, old_rank) for each skill that was drained
+        """
+        drained = []
+        for skill_name, skill in list(self.pending.items()):
+            field_exp = skill.field_exp
+            if field_exp > 0:
+                old_rank = skill.rank
+                skill.convert_field_exp_to_rank(int(fraction * field_exp))
+                drained.append((skill, old_rank))
+            if skill.field_exp <= 0:
+                del self.pending[skill_name]
+        return drained
+    
     def get_all_skills(self):
         """Return list of all skills in this group"""
         return list(self.skills.values())
     
-    def should_pulse(self, current_time, pulse_interval=None):
-        """Check if this group's skills should pulse"""
-        if self.last_pulse_time is None:
+    def start_pulse_timer(self):
+        """Start the pulse timer if it isn't already running"""
+        if self.last_pulse_time_ns is None:
+            self.last_pulse_time_ns = time.monotonic_ns()
+            self.last_pulse_time = time.time()
+    
+    def should_pulse(self, now_ns, pulse_interval_ns=None):
+        """
+        Check if this group's skills should pulse.
+        
+        Args:
+            now_ns: Current time from time.monotonic_ns()
+            pulse_interval_ns: Interval override in nanoseconds
+        """
+        if self.last_pulse_time_ns is None:
             return False
         
-        time_since_pulse = current_time - self.last_pulse_time
-        check_interval = pulse_interval if pulse_interval is not None else self.pulse_interval
-        return time_since_pulse >= check_interval
+        if pulse_interval_ns is None:
+            pulse_interval_ns = self.pulse_interval * _NS_PER_S
+        return now_ns - self.last_pulse_time_ns >= pulse_interval_ns
     
-    def pulse(self, current_time, wisdom_modifier=0.0):
+    def pulse(self, now_ns, wisdom_modifier=0.0):
         """Execute pulse: convert field exp to ranks for all skills"""
-        if not self.should_pulse(current_time):
+        if not self.should_pulse(now_ns):
             return
         
-        pulse_size = self.calculate_pulse_size(wisdom_modifier)
-        
-        for skill in self.skills.values():
-            if skill.field_exp > 0:
-                bits_to_drain = int(pulse_size * skill.field_exp)
-                skill.convert_field_exp_to_rank(bits_to_drain)
+        self.drain_pending(self.calculate_pulse_size(wisdom_modifier))
         
-        self.last_pulse_time = current_time
+        self.last_pulse_time_ns = now_ns
+        self.last_pulse_time = time.time()
     
     def calculate_pulse_size(self, wisdom_modifier=0.0):
         """Calculate what fraction of the pool drains in this pulse"""
-        base_drain_rates = {
-            "primary": 0.05,
-            "secondary": 0.04,
-            "tertiary": 0.03,
-            "else": 0.02,
-        }
-        
-        base_rate = base_drain_rates.get(self.skillset_placement, 0.02)
+        base_rate = _BASE_DRAIN_RATES.get(self.skillset_placement, 0.02)
         wisdom_bonus = 1.0 + (wisdom_modifier * 0.5)
         
         return base_rate * wisdom_bonus
@@ -190,10 +256,19 @@ class SkillGroup:
         self.pulse_interval = data.get("pulse_interval", 5 * 60)
         self.last_pulse_time = data.get("last_pulse_time")
         
+        # Monotonic clocks don't survive a reboot; rebase on the wall-clock age
+        if self.last_pulse_time is None:
+            self.last_pulse_time_ns = None
+        else:
+            age_ns = int(max(0.0, time.time() - self.last_pulse_time) * _NS_PER_S)
+            self.last_pulse_time_ns = time.monotonic_ns() - age_ns
+        
         for sname, sdata in data.get("skills", {}).items():
             skill = Skill(sname)
             skill.from_dict(sdata)
             self.skills[sname] = skill
+            if skill.field_exp > 0:
+                self.pending[sname] = skill
 
 
 class SkillRegistry:
@@ -204,12 +279,19 @@ class SkillRegistry:
     
     def __init__(self):
         self.skills = {}  # skill_name -> skill metadata
+        self.skill_categories = {}  # skill_name -> category, in sorted name order
+        self.skill_templates = {}  # skill_name -> shared zero-progress Skill (read-only)
+        self._by_lc_name = {}  # lowercased skill_name -> skill_name
+        self.category_index = {}  # lowercased category -> sorted [skill_name]
+        self._category_by_lc = {}  # lowercased category -> category
+        self._sorted_categories = []
+        self.weapon_class_index = {}  # weapon_class -> skill_name
+        self.armor_type_index = {}  # armor_type -> skill_name
     
     def load_from_yaml(self, filepath):
         """Load skill definitions from YAML config"""
         try:
-            with open(filepath, 'r') as f:
-                config = yaml.safe_load(f)
+            config = yaml.load(filepath)
         except Exception as e:
             mud.log_string("ERROR: Failed to load skills config: %s" % str(e))
             return False
@@ -223,40 +305,98 @@ class SkillRegistry:
             mud.log_string("ERROR: skills is not a list, it's: %s" % type(skills_list))
             return False
     
+        # Malformed entries are collected and reported once per kind
+        not_dict = []
+        no_name = []
+        bad_name = []
+    
         for idx, skill_data in enumerate(skills_list):
-            # Debug: check what we got
             if not isinstance(skill_data, dict):
-                mud.log_string("WARNING: Skill item %d is not a dict, it's %s: %s" % 
-                              (idx, type(skill_data), skill_data))
+                not_dict.append(idx)
                 continue
         
             skill_name = skill_data.get('name')
-        
-            # Debug: check if name is valid
             if skill_name is None:
-                mud.log_string("WARNING: Skill item %d has no 'name' key. Keys: %s" % 
-                              (idx, list(skill_data.keys())))
+                no_name.append(idx)
                 continue
         
             if not isinstance(skill_name, str):
-                mud.log_string("WARNING: Skill name is not a string, it's %s: %s (item %d)" % 
-                              (type(skill_name), skill_name, idx))
+                bad_name.append(idx)
                 continue
         
+            # Interned so every Skill/requirement shares one string object
+            skill_name = sys.intern(skill_name)
+        
+            # Categories may be written as a one-item YAML list
+            category = skill_data.get('category', 'Miscellaneous')
+            if isinstance(category, list):
+                category = category[0] if category else 'Miscellaneous'
+        
             # Now we know skill_name is a valid string
             self.skills[skill_name] = {
                 'name': skill_name,
-                'category': skill_data.get('category', 'Miscellaneous'),
+                'category': category,
                 'description': skill_data.get('description', ''),
             }
+        
+            # Reverse indexes for gear lookups (first skill listed wins)
+            if 'weapon_class' in skill_data:
+                self.weapon_class_index.setdefault(skill_data['weapon_class'], skill_name)
+            if 'armor_type' in skill_data:
+                self.armor_type_index.setdefault(skill_data['armor_type'], skill_name)
+    
+        for indices, problem in ((not_dict, "are not mappings"),
+                                 (no_name, "have no 'name' key"),
+                                 (bad_name, "have a non-string name")):
+            if indices:
+                mud.log_string("WARNING: %d skill entries %s (items: %s%s)" % 
+                              (len(indices), problem, indices[:10],
+                               " ..." if len(indices) > 10 else ""))
+    
+        self._build_indexes()
     
         if self.skills:
-            mud.log_string("SKILLS: Loaded %d skill definitions from config" % len(self.skills))
+            if DEBUG_SKILL_LOAD:
+                mud.log_string("SKILLS: Loaded %d skill definitions from config" % len(self.skills))
             return True
         else:
             mud.log_string("WARNING: No skills loaded from config (processed %d items)" % len(skills_list))
             return False
 
+    def _build_indexes(self):
+        """Precompute per-skill lookups used by the display commands"""
+        self.skill_categories = {}
+        self.skill_templates = {}
+        self._by_lc_name = {}
+        self.category_index = {}
+        self._category_by_lc = {}
+        for skill_name in sorted(self.skills):
+            category = self.skills[skill_name].get('category', 'Miscellaneous')
+            self.skill_categories[skill_name] = category
+            self.skill_templates[skill_name] = Skill(skill_name)
+            self._by_lc_name[skill_name.lower()] = skill_name
+            self.category_index.setdefault(category.lower(), []).append(skill_name)
+            self._category_by_lc.setdefault(category.lower(), category)
+        self._sorted_categories = sorted(set(self.skill_categories.values()))
+    
+    def resolve_category(self, name):
+        """
+        Get the registered spelling of a category, ignoring case.
+        
+        Returns:
+            str or None: Category name if any skill uses it
+        """
+        return self._category_by_lc.get(name.strip().lower())
+    
+    def resolve_skill_name(self, name):
+        """
+        Get the registered spelling of a skill name, ignoring case.
+        
+        Returns:
+            str or None: Canonical skill name if registered
+        """
+        return self._by_lc_name.get(name.strip().lower())
+    
     def get_skill_info(self, skill_name):
         """Get skill metadata"""
         return self.skills.get(skill_name)
@@ -284,6 +424,48 @@ def get_skill_registry():
     return _skill_registry
 
 
+# class_name -> (skills config it was built from, skill layout)
+_skill_template_cache = {}
+
+
+def _get_class_skill_layout(class_config):
+    """
+    Get the validated skill layout for a class config, building it once per class.
+    Different configs can share a class_name (the ad-hoc 'Novice' setups), and a
+    reloaded class YAML changes the section, so a cached layout is only reused
+    while its skills section is still equal to the one passed in.
+    
+    Returns:
+        list: (placement, group_name, skill_names) for each non-empty tier
+    """
+    class_name = class_config.get('class_name', 'Unknown')
+    skills_config = class_config.get('skills', {})
+    
+    cached = _skill_template_cache.get(class_name)
+    if cached is not None and cached[0] == skills_config:
+        return cached[1]
+    
+    registry = get_skill_registry()
+    layout = []
+    for placement in ['primary', 'secondary', 'tertiary', 'else']:
+        skill_names = []
+        for skill_name in skills_config.get(placement, []):
+            # Verify skill exists in registry
+            if registry.skill_exists(skill_name):
+                skill_names.append(skill_name)
+            else:
+                mud.log_string("WARNING: Skill '%s' not found in registry (class %s)" % 
+                              (skill_name, class_config.get('class_name')))
+        
+        if skill_names:  # Only add if group has skills
+            group_name = f"{class_config.get('class_name', 'Class')} {placement.title()}"
+            layout.append((placement, group_name, tuple(skill_names)))
+    
+    # Keep our own copy so later edits to the caller's dict can't match it
+    _skill_template_cache[class_name] = (copy.deepcopy(skills_config), layout)
+    return layout
+
+
 def setup_skills_from_class_config(ch, class_config):
     """
     Initialize skill system for a character based on their class config.
@@ -298,29 +480,20 @@ def setup_skills_from_class_config(ch, class_config):
     if skill_aux is None:
         skill_aux = ch.createAuxiliary("skills")
     
-    skill_aux.groups = {}
+    # Clear in place so cached references to the groups dict stay valid
+    skill_aux.groups.clear()
+    skill_aux.skill_index = {}
     skill_aux.class_name = class_config.get('class_name', 'Unknown')
     
-    # Get skill placement from class config
-    skills_config = class_config.get('skills', {})
-    
     # Create skill groups for each placement tier
-    for placement in ['primary', 'secondary', 'tertiary', 'else']:
-        skill_names = skills_config.get(placement, [])
+    for placement, group_name, skill_names in _get_class_skill_layout(class_config):
+        group = SkillGroup(group_name, placement)
+        for skill_name in skill_names:
+            group.add_skill(skill_name)
         
-        if skill_names:
-            group = SkillGroup(f"{class_config.get('class_name', 'Class')} {placement.title()}", placement)
-            
-            for skill_name in skill_names:
-                # Verify skill exists in registry
-                if get_skill_registry().skill_exists(skill_name):
-                    group.add_skill(skill_name)
-                else:
-                    mud.log_string("WARNING: Skill '%s' not found in registry (class %s)" % 
-                                  (skill_name, class_config.get('class_name')))
-            
-            if group.get_all_skills():  # Only add if group has skills
-                skill_aux.groups[placement] = group
+        skill_aux.groups[placement] = group
+        for skill in group.skills.values():
+            skill_aux.skill_index[skill.name] = (placement, skill)
     
     mud.log_string("SKILLS: Initialized %d skill groups for %s (class: %s)" % 
                   (len(skill_aux.groups), ch.name, class_config.get('class_name')))
@@ -334,49 +507,60 @@ def get_skills(ch):
     return {}
 
 
+def _get_skill_index(ch):
+    """Get character's skill_name -> (placement, Skill) index"""
+    skill_aux = ch.getAuxiliary("skills")
+    if skill_aux and hasattr(skill_aux, 'skill_index'):
+        return skill_aux.skill_index
+    return {}
+
+
 def get_skill(ch, skill_name):
-    """Get a specific skill by name (searches all groups)"""
-    groups = get_skills(ch)
-    for group in groups.values():
-        skill = group.get_skill(skill_name)
-        if skill:
-            return skill
+    """Get a specific skill by name"""
+    entry = _get_skill_index(ch).get(skill_name)
+    if entry:
+        return entry[1]
     return None
 
 
 def get_skill_placement(ch, skill_name):
     """Get the placement tier of a skill for this character"""
-    groups = get_skills(ch)
-    for placement, group in groups.items():
-        if group.get_skill(skill_name):
-            return placement
+    entry = _get_skill_index(ch).get(skill_name)
+    if entry:
+        return entry[0]
     return None
 
 
 def get_skill_rank(ch, skill_name):
     """Get integer rank of a skill"""
-    skill = get_skill(ch, skill_name)
-    if skill:
-        return int(skill.rank)
+    entry = _get_skill_index(ch).get(skill_name)
+    if entry:
+        return int(entry[1].rank)
     return 0
 
 
+def get_rank_map(ch):
+    """
+    Snapshot every skill's integer rank in a single pass over the skill index.
+    Use this when checking many skills at once (e.g. level requirements).
+    
+    Returns:
+        dict: {skill_name: int rank}
+    """
+    return {name: int(entry[1].rank) for name, entry in _get_skill_index(ch).items()}
+
+
 def get_skill_rank_with_fraction(ch, skill_name):
     """Get full rank with fractional bits (e.g., 12.31)"""
-    skill = get_skill(ch, skill_name)
-    if skill:
-        return skill.rank
+    entry = _get_skill_index(ch).get(skill_name)
+    if entry:
+        return entry[1].rank
     return 0.0
 
 
 def get_all_skills_for_character(ch):
     """Get all skills available to this character"""
-    all_skills = {}
-    groups = get_skills(ch)
-    for group in groups.values():
-        for skill in group.get_all_skills():
-            all_skills[skill.name] = skill
-    return all_skills
+    return {name: entry[1] for name, entry in _get_skill_index(ch).items()}
 
 
 def get_skills_with_progress(ch):
@@ -398,13 +582,12 @@ def get_skills_with_progress(ch):
     
     # Organize by category
     by_category = {}
-    for skill_name in skills_with_progress:
-        skill_info = registry.get_skill_info(skill_name)
-        if skill_info:
-            category = skill_info.get('category', 'Miscellaneous')
+    for skill_name, skill in skills_with_progress.items():
+        category = registry.skill_categories.get(skill_name)
+        if category:
             if category not in by_category:
                 by_category[category] = []
-            by_category[category].append(skills_with_progress[skill_name])
+            by_category[category].append(skill)
     
     return by_category
 
@@ -426,17 +609,11 @@ def get_skills_by_category(ch, category, all_skills=False):
     
     if all_skills:
         # Return all skills in category, add progress data
-        skills = []
-        for skill_name, skill_info in registry.skills.items():
-            if skill_info.get('category', 'Miscellaneous').lower() == category.lower():
-                char_skill = get_skill(ch, skill_name)
-                if char_skill:
-                    skills.append(char_skill)
-                else:
-                    # Create new skill with 0 progress for display
-                    new_skill = Skill(skill_name)
-                    skills.append(new_skill)
-        return skills
+        char_skills = get_all_skills_for_character(ch)
+        templates = registry.skill_templates
+        # Fall back to the shared 0-progress template for display
+        return [char_skills.get(skill_name) or templates[skill_name]
+                for skill_name in registry.category_index.get(category.lower(), ())]
     else:
         # Return only skills with progress
         by_category = get_skills_with_progress(ch)
@@ -445,8 +622,7 @@ def get_skills_by_category(ch, category, all_skills=False):
 
 def get_total_ranks(ch):
     """Get total of all integer ranks (excluding fractional parts)"""
-    all_skills = get_all_skills_for_character(ch)
-    return sum(int(skill.rank) for skill in all_skills.values())
+    return sum(int(entry[1].rank) for entry in _get_skill_index(ch).values())
 
 
 def lookup_skill_by_weapon_class(weapon_class):
@@ -463,13 +639,7 @@ def lookup_skill_by_weapon_class(weapon_class):
         >>> lookup_skill_by_weapon_class("long_blades")
         "Long Blades"
     """
-    registry = get_skill_registry()
-    
-    for skill_name, skill_info in registry.skills.items():
-        if skill_info.get('weapon_class') == weapon_class:
-            return skill_name
-    
-    return None
+    return get_skill_registry().weapon_class_index.get(weapon_class)
 
 
 def lookup_skill_by_armor_type(armor_type):
@@ -486,13 +656,7 @@ def lookup_skill_by_armor_type(armor_type):
         >>> lookup_skill_by_armor_type("heavy")
         "Heavy Armor"
     """
-    registry = get_skill_registry()
-    
-    for skill_name, skill_info in registry.skills.items():
-        if skill_info.get('armor_type') == armor_type:
-            return skill_name
-    
-    return None
+    return get_skill_registry().armor_type_index.get(armor_type)
 
 
 def get_skills_in_category(category):
@@ -505,14 +669,7 @@ def get_skills_in_category(category):
     Returns:
         list: List of skill names in that category
     """
-    registry = get_skill_registry()
-    result = []
-    
-    for skill_name, skill_info in registry.skills.items():
-        if skill_info.get('category', '').lower() == category.lower():
-            result.append(skill_name)
-    
-    return sorted(result)
+    return list(get_skill_registry().category_index.get(category.lower(), ()))
 
 
 def get_weapon_skills():
@@ -552,21 +709,11 @@ def format_skill_display(skill, width=40):
         str: Formatted skill display
     """
     rank_int = int(skill.rank)
-    percentage = skill.get_percentage_to_next_rank()
-    
-    skill_part = skill.name.ljust(width)
-    rank_part = "{y%d.%02d{n" % (rank_int, percentage)
+    percentage = int((skill.field_exp / _BITS_TO_NEXT[rank_int]) * 100)
     
-    return skill_part + rank_part
+    return "%-*s{y%d.%02d{n" % (width, skill.name, rank_int, percentage)
 
 
 def get_all_categories():
     """Get sorted list of all skill categories"""
-    registry = get_skill_registry()
-    categories = set()
-    
-    for skill_info in registry.skills.values():
-        category = skill_info.get('category', 'Miscellaneous')
-        categories.add(category)
-    
-    return sorted(list(categories))
\ No newline at end of file
+    return list(get_skill_registry()._sorted_categories)
\ No newline at end of file
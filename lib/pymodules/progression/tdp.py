@@ -6,6 +6,29 @@ Integrates with attributes system for TDP storage.
 """
 
 import mud
+from functools import lru_cache
+
+# Try to import attributes module, which stores TDP on characters
+try:
+    import attributes.attribute_aux as attribute_aux
+    ATTRIBUTES_AVAILABLE = True
+except ImportError:
+    ATTRIBUTES_AVAILABLE = False
+    mud.log_string("tdp: Attributes module not available")
+
+# Log every TDP award (errors are always logged)
+LOG_TDP_AWARDS = True
+
+# Rank tiers for skill TDP: ranks below each bound pay the matching rate,
+# ranks at or past the last bound pay _TDP_TOP_RATE
+_TDP_TIER_BOUNDS = (100, 200, 500, 1000)
+_TDP_TIER_RATES = (1, 2, 3, 4)
+_TDP_TOP_RATE = 5
+
+# Skill-rank TDP award log lines waiting to be written: ch.uid -> [name, tdp, ranks]
+# The TDP itself is added immediately; flush_pending_tdp() logs one line per
+# character per tick
+_PENDING_TDP = {}
 
 
 def grant_tdp_for_skill_rank(ch, old_rank, new_rank):
@@ -24,49 +47,132 @@ def grant_tdp_for_skill_rank(ch, old_rank, new_rank):
         old_rank: Previous rank (float)
         new_rank: New rank (float)
     
+    The award is added to the character's attributes right away; its log
+    line is written by the next flush_pending_tdp().
+    
     Returns:
         int: Total TDP granted
     """
+    # Most calls are fractional gains that cross no whole rank
+    old_rank_int = int(old_rank)
+    new_rank_int = int(new_rank)
+    if new_rank_int <= old_rank_int:
+        return 0
+    
     # Get attribute auxiliary for TDP storage
-    try:
-        from attributes import attribute_aux
-        attr_aux = attribute_aux.get_attributes(ch)
-        if not attr_aux:
-            mud.log_string("ERROR: Cannot grant TDP - no attributes for %s" % ch.name)
-            return 0
-    except ImportError:
+    if not ATTRIBUTES_AVAILABLE:
         mud.log_string("ERROR: Cannot grant TDP - attributes module not available")
         return 0
+    attr_aux = attribute_aux.get_attributes(ch)
+    if not attr_aux:
+        mud.log_string("ERROR: Cannot grant TDP - no attributes for %s" % ch.name)
+        return 0
     
-    # Calculate TDP for each rank gained
-    total_tdp = 0
-    old_rank_int = int(old_rank)
-    new_rank_int = int(new_rank)
-    
-    for rank in range(old_rank_int, new_rank_int):
-        tdp_for_rank = _get_tdp_for_rank(rank)
-        total_tdp += tdp_for_rank
+    # TDP for ranks [old, new) is the difference of the running totals
+    total_tdp = _cumulative_tdp(new_rank_int) - _cumulative_tdp(old_rank_int)
     
     if total_tdp > 0:
         attr_aux.add_tdp(total_tdp)
-        mud.log_string("TDP: %s gained %d TDP (rank %d -> %d)" % 
-                      (ch.name, total_tdp, old_rank_int, new_rank_int))
+        _queue_tdp_log(ch, total_tdp, new_rank_int - old_rank_int)
+    
+    return total_tdp
+
+
+def grant_tdp_for_skill_ranks(ch, rank_changes):
+    """
+    Grant TDP for several skill advancements with one attribute lookup.
+    
+    Args:
+        ch: Character
+        rank_changes: Iterable of (old_rank, new_rank) pairs
+    
+    Returns:
+        int: Total TDP granted
+    """
+    total_tdp = 0
+    ranks = 0
+    for old_rank, new_rank in rank_changes:
+        old_rank_int = int(old_rank)
+        new_rank_int = int(new_rank)
+        if new_rank_int > old_rank_int:
+            total_tdp += _cumulative_tdp(new_rank_int) - _cumulative_tdp(old_rank_int)
+            ranks += new_rank_int - old_rank_int
+    
+    if total_tdp <= 0:
+        return 0
+    
+    if not ATTRIBUTES_AVAILABLE:
+        mud.log_string("ERROR: Cannot grant TDP - attributes module not available")
+        return 0
+    attr_aux = attribute_aux.get_attributes(ch)
+    if not attr_aux:
+        mud.log_string("ERROR: Cannot grant TDP - no attributes for %s" % ch.name)
+        return 0
+    
+    attr_aux.add_tdp(total_tdp)
+    _queue_tdp_log(ch, total_tdp, ranks)
     
     return total_tdp
 
 
-def _get_tdp_for_rank(rank):
-    """Get TDP awarded for reaching a specific rank"""
-    if rank < 100:
-        return 1
-    elif rank < 200:
-        return 2
-    elif rank < 500:
-        return 3
-    elif rank < 1000:
-        return 4
+def _queue_tdp_log(ch, total_tdp, ranks):
+    """Add a skill-rank TDP award to the character's pending log line"""
+    if not LOG_TDP_AWARDS:
+        return
+    pending = _PENDING_TDP.get(ch.uid)
+    if pending is None:
+        _PENDING_TDP[ch.uid] = [ch.name, total_tdp, ranks]
+    else:
+        pending[1] += total_tdp
+        pending[2] += ranks
+
+
+def flush_pending_tdp(ch=None):
+    """
+    Write the queued skill-rank TDP award log lines.
+    
+    Args:
+        ch: Only flush this character (default: everyone pending)
+    """
+    if not _PENDING_TDP:
+        return
+    
+    if ch is not None:
+        pending = _PENDING_TDP.pop(ch.uid, None)
+        entries = (pending,) if pending else ()
     else:
-        return 5
+        entries = list(_PENDING_TDP.values())
+        _PENDING_TDP.clear()
+    
+    if entries:
+        mud.log_string("\n".join("TDP: %s gained %d TDP (%d skill ranks)" % (name, total_tdp, ranks)
+                                 for name, total_tdp, ranks in entries))
+
+
+def tdp_flush_hook(info):
+    """Heartbeat/shutdown hook that logs the TDP awarded since the last flush"""
+    flush_pending_tdp()
+
+
+@lru_cache(maxsize=4096)
+def _cumulative_tdp(rank):
+    """
+    Total TDP awarded for ranks 0 through rank - 1.
+    
+    Args:
+        rank: Integer rank
+    
+    Returns:
+        int: Sum of the per-rank tier rates over [0, rank)
+    """
+    total = 0
+    lower = 0
+    for bound, rate in zip(_TDP_TIER_BOUNDS, _TDP_TIER_RATES):
+        if rank <= bound:
+            return total + rate * (rank - lower)
+        total += rate * (bound - lower)
+        lower = bound
+    return total + _TDP_TOP_RATE * (rank - lower)
 
 
 def grant_tdp_for_level(ch, level_num, amount):
@@ -81,20 +187,18 @@ def grant_tdp_for_level(ch, level_num, amount):
     Returns:
         bool: True if successful
     """
-    try:
-        from attributes import attribute_aux
-        attr_aux = attribute_aux.get_attributes(ch)
-        if not attr_aux:
-            return False
-        
-        attr_aux.add_tdp(amount)
-        mud.log_string("TDP: %s gained %d TDP from reaching level %d" % 
-                      (ch.name, amount, level_num))
-        return True
-    
-    except ImportError:
+    if not ATTRIBUTES_AVAILABLE:
         mud.log_string("ERROR: Cannot grant level TDP - attributes module not available")
         return False
+    attr_aux = attribute_aux.get_attributes(ch)
+    if not attr_aux:
+        return False
+    
+    attr_aux.add_tdp(amount)
+    if LOG_TDP_AWARDS:
+        mud.log_string("TDP: %s gained %d TDP from reaching level %d" % 
+                      (ch.name, amount, level_num))
+    return True
 
 
 def get_available_tdp(ch):
@@ -107,13 +211,10 @@ def get_available_tdp(ch):
     Returns:
         int: Available TDP
     """
-    try:
-        from attributes import attribute_aux
+    if ATTRIBUTES_AVAILABLE:
         attr_aux = attribute_aux.get_attributes(ch)
         if attr_aux:
             return attr_aux.tdp_available
-    except ImportError:
-        pass
     
     return 0
 
@@ -128,13 +229,10 @@ def get_spent_tdp(ch):
     Returns:
         int: Spent TDP
     """
-    try:
-        from attributes import attribute_aux
+    if ATTRIBUTES_AVAILABLE:
         attr_aux = attribute_aux.get_attributes(ch)
         if attr_aux:
             return attr_aux.tdp_spent
-    except ImportError:
-        pass
     
     return 0
 
@@ -149,4 +247,9 @@ def get_total_tdp(ch):
     Returns:
         int: Total TDP earned
     """
-    return get_available_tdp(ch) + get_spent_tdp(ch)
\ No newline at end of file
+    if ATTRIBUTES_AVAILABLE:
+        attr_aux = attribute_aux.get_attributes(ch)
+        if attr_aux:
+            return attr_aux.tdp_available + attr_aux.tdp_spent
+    
+    return 0
\ No newline at end of file
@@ -4,52 +4,135 @@ YAML Parser with PyYAML Integration
 Tries to use PyYAML if available, falls back to custom parser.
 """
 #import json
+import os
+import pickle
+import re
+import sys
 
-# Try to import PyYAML first
+# Try to import PyYAML first, preferring the libyaml-backed loader
 try:
     import yaml
     HAS_PYYAML = True
+    try:
+        from yaml import CSafeLoader as _SafeLoader
+    except ImportError:
+        from yaml import SafeLoader as _SafeLoader
 except ImportError:
     HAS_PYYAML = False
 
+# filepath -> ((mtime_ns, size), parsed result) for load()
+_LOAD_CACHE = {}
+
+# load() also keeps a pickled copy of each parse next to the source file
+PARSE_CACHE_SUFFIX = ".cache"
+
+# Bump whenever the custom parser's output changes, so stale sidecars are
+# thrown away instead of being served
+PARSER_VERSION = 1
+
+# Scalar classification for the custom parser
+_LITERALS = {
+    'true': True, 'True': True, 'TRUE': True,
+    'false': False, 'False': False, 'FALSE': False,
+    'null': None, 'Null': None, 'NULL': None,
+    'none': None, 'None': None, 'NONE': None,
+    '~': None, '': None,
+}
+_DIGITS = r'\d+(?:_\d+)*'
+_INT_RE = re.compile(r'[-+]?%s$' % _DIGITS)
+_FLOAT_RE = re.compile(r'[-+]?(?=\.?\d)(?:%s)?\.(?:%s)?(?:[eE][-+]?%s)?$' %
+                       (_DIGITS, _DIGITS, _DIGITS))
+
 
 def safe_load(content):
     """
     Parse YAML content using PyYAML if available, otherwise custom parser.
     
     Args:
-        content: YAML string or file object
+        content: YAML string, bytes or file object
     
     Returns:
         dict: Parsed YAML
     """
     if HAS_PYYAML:
-        if isinstance(content, str):
-            return yaml.safe_load(content)
-        else:
-            # It's a file object
-            return yaml.safe_load(content)
+        # Strings, bytes and file objects are all accepted by the loader
+        return yaml.load(content, Loader=_SafeLoader)
     else:
         # Use custom parser
-        if isinstance(content, str):
-            return parse_yaml(content)
-        else:
+        if not isinstance(content, (str, bytes)):
             # It's a file object - read it
-            return parse_yaml(content.read())
+            content = content.read()
+        if isinstance(content, bytes):
+            content = content.decode('utf-8-sig')
+        return parse_yaml(content)
 
 
 def load(filepath):
     """
     Load and parse a YAML file.
     
+    Results are cached in memory and in a pickled sidecar file until the
+    file's mtime or size changes. The cached object is returned directly,
+    so callers must not modify it.
+    
     Args:
         filepath: Path to YAML file
     
     Returns:
         dict: Parsed YAML
     """
-    with open(filepath, 'r') as f:
-        return safe_load(f)
+    st = os.stat(filepath)
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _LOAD_CACHE.get(filepath)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    
+    # The parsers can disagree on malformed input, so the sidecar records
+    # which one (and which version of ours) produced it
+    cache_path = filepath + PARSE_CACHE_SUFFIX
+    cache_key = key + (HAS_PYYAML, PARSER_VERSION)
+    found, result = _read_parse_cache(cache_path, cache_key)
+    if not found:
+        # Binary mode lets libyaml do its own decoding
+        with open(filepath, 'rb') as f:
+            result = safe_load(f)
+        _write_parse_cache(cache_path, cache_key, result)
+    
+    _LOAD_CACHE[filepath] = (key, result)
+    return result
+
+
+def _read_parse_cache(cache_path, cache_key):
+    """
+    Read a pickled parse written by _write_parse_cache.
+    
+    Returns:
+        tuple: (found, result); found is False for a missing or stale cache
+    """
+    try:
+        with open(cache_path, 'rb') as f:
+            stored_key, result = pickle.load(f)
+    except Exception:
+        return (False, None)
+    if stored_key != cache_key:
+        return (False, None)
+    return (True, result)
+
+
+def _write_parse_cache(cache_path, cache_key, result):
+    """Pickle a parse next to its source; failures just skip the cache"""
+    tmp_path = "%s.%d.tmp" % (cache_path, os.getpid())
+    try:
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((cache_key, result), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except Exception:
+        # Unpicklable or too deeply nested results land here as well as
+        # disk errors; none of them should fail the load
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
 
 
 # =============================================================================
@@ -60,283 +143,129 @@ def parse_yaml(content):
     """
     Parse YAML string content using custom parser.
     
+    Lines are scanned once, left to right, with a stack of the containers
+    that are still open. Each stack entry records the smallest indent a line
+    may have and still belong to that container.
+    
     Args:
         content: YAML string
     
     Returns:
         dict or list: Parsed content
     """
-    lines = content.split('\n')
-    lines = [line for line in lines if line.strip() and not line.strip().startswith('#')]
+    # Indent, stripped text, list-item flag and first colon position are
+    # computed once per line; the parse loop below only slices
+    tokens = []
+    for line in content.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped[0] == '#':
+            continue
+        indent = len(line) - len(line.lstrip(' \t'))
+        if '\t' in line[:indent]:
+            indent = _get_indent(line)
+        tokens.append((indent, stripped, stripped.startswith('- '), stripped.find(':')))
     
-    if not lines:
+    if not tokens:
         return {}
     
-    result = _parse_lines(lines, 0, None)
-    return result[0] if result else {}
-
-
-def _parse_lines(lines, start_idx, parent_indent):
-    """
-    Recursively parse lines.
-    
-    Returns:
-        tuple: (parsed_value, next_line_index)
-    """
-    if start_idx >= len(lines):
-        return (None, start_idx)
-    
-    line = lines[start_idx]
-    indent = _get_indent(line)
-    stripped = line.strip()
-    
-    # Check for list item
-    if stripped.startswith('- '):
-        return _parse_list(lines, start_idx, indent)
-    
-    # Check for key: value pair
-    if ':' in stripped:
-        return _parse_dict(lines, start_idx, indent)
+    first_indent, _, first_is_item, first_colon = tokens[0]
+    if first_is_item:
+        root = []
+    elif first_colon >= 0:
+        root = {}
+    else:
+        return None
     
-    return (None, start_idx)
-
-
-def _parse_list(lines, start_idx, list_indent):
-    """Parse a YAML list starting at start_idx"""
-    result = []
-    idx = start_idx
+    # (min_indent, container, is_list)
+    stack = [(first_indent, root, isinstance(root, list))]
+    # (container, key, key_indent) for a key whose value is on following lines
+    pending = None
     
-    while idx < len(lines):
-        line = lines[idx]
-        indent = _get_indent(line)
-        stripped = line.strip()
-        
-        # Stop if we've moved to a different indentation level
-        if indent < list_indent and stripped:
-            break
-        
-        # Skip empty lines
-        if not stripped:
-            idx += 1
-            continue
+    for indent, stripped, is_item, colon in tokens:
+        # A more deeply indented line opens the value of the pending key
+        if pending is not None:
+            container, key, key_indent = pending
+            pending = None
+            if indent > key_indent:
+                child = [] if is_item else {}
+                container[key] = child
+                stack.append((indent, child, is_item))
         
-        # Must be a list item at same level
-        if not stripped.startswith('- '):
-            if indent <= list_indent:
-                break
-        
-        # Extract list item value - might be on same line or next lines
-        item_content = stripped[2:].strip()  # Remove '- '
-        
-        # Check if there's content on the same line as the dash
-        if item_content:
-            # Simple inline item or start of dict: key: value
-            if ':' in item_content:
-                # It's a dict item that starts on this line
-                # Parse it as a single-key dict, then check for continuation
-                key, value = item_content.split(':', 1)
-                key = key.strip()
-                value = value.strip()
-                
-                item_dict = {key: _convert_value(value)}
-                
-                # Check for continued keys on following lines
-                next_idx = idx + 1
-                while next_idx < len(lines):
-                    next_line = lines[next_idx]
-                    next_indent = _get_indent(next_line)
-                    next_stripped = next_line.strip()
-                    
-                    # Stop if we hit another list item or lower indent
-                    if not next_stripped or next_stripped.startswith('- '):
-                        break
-                    if next_indent <= list_indent:
-                        break
-                    
-                    # This line is part of the current dict
-                    if ':' in next_stripped:
-                        k, v = next_stripped.split(':', 1)
-                        k = k.strip()
-                        v = v.strip()
-                        
-                        # Check if value is nested (next indent > current)
-                        if not v:
-                            # Value is on following lines
-                            peek_idx = next_idx + 1
-                            if peek_idx < len(lines):
-                                peek_line = lines[peek_idx]
-                                peek_indent = _get_indent(peek_line)
-                                peek_stripped = peek_line.strip()
-                                
-                                if peek_indent > next_indent and peek_stripped:
-                                    if peek_stripped.startswith('- '):
-                                        parsed_val, peek_idx = _parse_list(lines, peek_idx, peek_indent)
-                                    else:
-                                        parsed_val, peek_idx = _parse_dict(lines, peek_idx, peek_indent)
-                                    item_dict[k] = parsed_val
-                                    next_idx = peek_idx
-                                    continue
-                        
-                        item_dict[k] = _convert_value(v)
-                        next_idx += 1
-                    else:
-                        break
-                
-                result.append(item_dict)
-                idx = next_idx
-            else:
-                # Simple scalar value
-                result.append(_convert_value(item_content))
-                idx += 1
-        else:
-            # No content on same line as dash, dict/value is on next lines
-            next_idx = idx + 1
-            
-            if next_idx < len(lines):
-                next_line = lines[next_idx]
-                next_indent = _get_indent(next_line)
-                next_stripped = next_line.strip()
-                
-                if next_indent > list_indent and next_stripped:
-                    if next_stripped.startswith('- '):
-                        # Nested list
-                        parsed_value, next_idx = _parse_list(lines, next_idx, next_indent)
-                    else:
-                        # Dict with multiple keys
-                        parsed_value, next_idx = _parse_dict(lines, next_idx, next_indent)
-                    
-                    result.append(parsed_value)
-                    idx = next_idx
-                else:
-                    idx += 1
+        # Close containers this line does not belong to
+        while stack:
+            min_indent, container, is_list = stack[-1]
+            if indent < min_indent or is_list != is_item:
+                stack.pop()
             else:
-                idx += 1
-    
-    return (result, idx)
-
-
-def _parse_dict(lines, start_idx, dict_indent):
-    """Parse a YAML dictionary starting at start_idx"""
-    result = {}
-    idx = start_idx
-    
-    while idx < len(lines):
-        line = lines[idx]
-        indent = _get_indent(line)
-        stripped = line.strip()
-        
-        # Stop if we've moved to a different indentation level
-        if indent < dict_indent and stripped:
+                break
+        if not stack:
             break
         
-        # Skip empty lines
-        if not stripped:
-            idx += 1
+        if is_list:
+            if colon >= 0:
+                # Start of a dict item; its further keys are indented past the dash
+                key = sys.intern(stripped[2:colon].strip())
+                item_dict = {key: _convert_value(stripped[colon + 1:])}
+                container.append(item_dict)
+                stack.append((min_indent + 1, item_dict, False))
+            else:
+                container.append(_convert_value(stripped[2:]))
             continue
         
-        # Skip list items (shouldn't be in a dict at same level)
-        if stripped.startswith('- '):
-            break
-        
-        # Must be a key: value pair
-        if ':' not in stripped:
-            idx += 1
+        if colon < 0:
             continue
         
-        # Extract key and value
-        key, value = stripped.split(':', 1)
-        key = key.strip()
-        value = value.strip()
-        
-        # Check if there's a value on the same line
+        # Keys repeat across thousands of entries; share one string per name
+        key = sys.intern(stripped[:colon].strip())
+        value = stripped[colon + 1:].strip()
         if value:
-            result[key] = _convert_value(value)
-            idx += 1
+            container[key] = _convert_value(value)
         else:
-            # Value is on next lines (nested structure)
-            next_idx = idx + 1
-            
-            if next_idx < len(lines):
-                next_line = lines[next_idx]
-                next_indent = _get_indent(next_line)
-                next_stripped = next_line.strip()
-                
-                if next_indent > indent:
-                    # It's nested
-                    if next_stripped.startswith('- '):
-                        # It's a list
-                        parsed_value, next_idx = _parse_list(lines, next_idx, next_indent)
-                    else:
-                        # It's a dict
-                        parsed_value, next_idx = _parse_dict(lines, next_idx, next_indent)
-                    
-                    result[key] = parsed_value
-                    idx = next_idx
-                else:
-                    idx += 1
-            else:
-                idx += 1
+            # Keys of a list item dict default to None until a nested value shows up
+            if len(stack) > 1 and stack[-2][2]:
+                container[key] = None
+            pending = (container, key, indent)
     
-    return (result, idx)
-
-
-def _parse_value_or_nested(lines, start_idx, value_indent):
-    """Parse a value that might be nested"""
-    line = lines[start_idx]
-    stripped = line.strip()
-    
-    if stripped.startswith('- '):
-        return _parse_list(lines, start_idx, value_indent)
-    elif ':' in stripped:
-        return _parse_dict(lines, start_idx, value_indent)
-    else:
-        return (_convert_value(stripped), start_idx + 1)
+    return root
 
 
 def _convert_value(value_str):
     """Convert a string value to appropriate Python type"""
     value_str = value_str.strip()
     
-    # Empty string
-    if not value_str:
-        return None
+    # Booleans, nulls and the empty string; no literal is longer than five
+    # characters, so longer values are never hashed
+    short = len(value_str) <= 5
+    if short and value_str in _LITERALS:
+        return _LITERALS[value_str]
     
-    # Boolean
-    if value_str.lower() == 'true':
-        return True
-    if value_str.lower() == 'false':
-        return False
+    # The first character decides which kinds of scalar are possible
+    first = value_str[0]
     
-    # Null
-    if value_str.lower() in ('null', 'none', '~'):
-        return None
+    # String (remove quotes if present)
+    if first == '"' or first == "'":
+        return value_str[1:-1] if value_str[-1] == first else value_str
     
     # Number
-    try:
-        if '.' in value_str:
-            return float(value_str)
-        else:
+    if first in '+-.' or first.isdigit():
+        if _INT_RE.match(value_str):
             return int(value_str)
-    except ValueError:
-        pass
+        if _FLOAT_RE.match(value_str):
+            return float(value_str)
     
-    # String (remove quotes if present)
-    if (value_str.startswith('"') and value_str.endswith('"')) or \
-       (value_str.startswith("'") and value_str.endswith("'")):
-        return value_str[1:-1]
+    # Odd-cased spellings such as 'tRue' still count as literals
+    if short:
+        lowered = value_str.lower()
+        if lowered in _LITERALS:
+            return _LITERALS[lowered]
     
     return value_str
 
 
 def _get_indent(line):
     """Get indentation level (spaces at start)"""
-    count = 0
-    for char in line:
-        if char == ' ':
-            count += 1
-        elif char == '\t':
-            count += 4  # Treat tab as 4 spaces
-        else:
-            break
-    return count
+    indent = len(line) - len(line.lstrip(' \t'))
+    if '\t' in line[:indent]:
+        return indent + 3 * line.count('\t', 0, indent)  # Treat tab as 4 spaces
+    return indent
 
@@ -47,17 +47,31 @@ Description of module concepts:
 """
 from mudsys import add_cmd, remove_cmd
 from cmd_checks import chk_conscious, chk_can_move, chk_grounded, chk_supine
-import mud, storage, char, auxiliary, time, string, hooks, mudsys
+import mud, storage, char, auxiliary, time, string, hooks, mudsys, re
 
-# This stores all the socials themselves, before unlinking
+# This stores all the socials themselves, keyed by social id
 social_table = { }
-# This stores all the socials after unlinking
+# This maps each social command keyword to its social id
 socials = { }
+# Last social id handed out by _register_social
+_last_social_id = 0
+# Set by save_socials; the socials file is rewritten on the next flush
+_dirty = False
+# Rendered 'socials' listing; reset to None whenever the command set changes
+_socials_display = None
 socials_file = "misc/socials"
 
+# Set once ensure_socials_file has run
+_ensured = False
+
 def ensure_socials_file():
     """Ensure socials file exists, copy from default if not"""
     import os
+    global _ensured
+    
+    if _ensured:
+        return
+    _ensured = True
     
     if not os.path.exists(socials_file):
         # Get the directory where this module is located
@@ -68,13 +82,10 @@ def ensure_socials_file():
             # Create misc directory if it doesn't exist
             os.makedirs(os.path.dirname(socials_file), exist_ok=True)
             
-            # Manual file copy - create file directly since we're in mudlib root
+            # We're already in the mudlib directory, so copy straight across
             try:
-                with open(default_socials, 'r') as src:
-                    content = src.read()
-                # Write directly to file - we're already in mudlib directory
-                with open(socials_file, 'w') as dst:
-                    dst.write(content)
+                import shutil
+                shutil.copyfile(default_socials, socials_file)
                 print(f"Created {socials_file} from default template")
             except Exception as e:
                 print(f"Error creating socials file: {e}")
@@ -84,13 +95,64 @@ def ensure_socials_file():
 # Initialize socials file on module load
 ensure_socials_file()
 
+# Matches the $x (adjective) and $X (modifier/adverb) tokens in social messages
+_TOKEN_RE = re.compile(r"\$([xX])")
+
+def _compile_template(msg):
+    """
+    Split a social message into literal chunks and token slots.
+
+    :param msg: the social message
+    :return: (literals, slots) where slot 0 is $x and 1 is $X, and there is
+             one more literal than there are slots
+    """
+    pieces = _TOKEN_RE.split(msg or "")
+    literals = tuple(pieces[0::2])
+    slots = tuple(0 if tok == "x" else 1 for tok in pieces[1::2])
+    return (literals, slots)
+
+# message text -> renderer from _build_renderer, shared by every social using it
+_renderers = { }
+
+def _build_renderer(msg):
+    """
+    Specialize a social message into the cheapest thing that renders it.
+
+    :param msg: the social message
+    :return: the message itself if it has no $x/$X tokens, otherwise a
+             function (modifier, adjective, adverb) -> str with the literal
+             chunks baked in. Tokens with nothing to fill them are left in
+             the message as-is.
+    """
+    renderer = _renderers.get(msg)
+    if renderer is not None:
+        return renderer
+
+    literals, slots = _compile_template(msg)
+    if not slots:
+        renderer = literals[0]
+    else:
+        terms = [ ]
+        for i, slot in enumerate(slots):
+            if literals[i]:
+                terms.append(repr(literals[i]))
+            terms.append("(adj or '$x')" if slot == 0 else "(mod or adv or '$X')")
+        if literals[-1]:
+            terms.append(repr(literals[-1]))
+        namespace = { }
+        exec("def render(mod, adj, adv):\n    return " + " + ".join(terms), namespace)
+        renderer = namespace["render"]
+
+    _renderers[msg] = renderer
+    return renderer
+
 class Social:
     def __init__(self, cmds = "", to_char_notgt = "", to_room_notgt = "", to_char_self = "",
                  to_room_self = "", to_char_tgt = "", to_vict_tgt = "", to_room_tgt = "",
                  adverb = "", adjective = "", require_tgt = "", min_pos = "", max_pos = "",
                  storeSet = None):
         if not storeSet == None:
-            self.cmds = storeSet.readString("cmds")
+            cmds = storeSet.readString("cmds")
             self.to_char_notgt = storeSet.readString("to_char_notgt")
             self.to_room_notgt = storeSet.readString("to_room_notgt")
             self.to_char_self = storeSet.readString("to_char_self")
@@ -104,7 +166,6 @@ class Social:
             self.min_pos = storeSet.readString("min_pos")
             self.max_pos = storeSet.readString("max_pos")
         else:
-            self.cmds = cmds
             self.to_char_notgt = to_char_notgt
             self.to_room_notgt = to_room_notgt
             self.to_char_self = to_char_self
@@ -117,25 +178,42 @@ class Social:
             self.require_tgt = require_tgt
             self.min_pos = min_pos
             self.max_pos = max_pos
+        # command keywords are kept split; cmds is only joined for display/saving
+        self.keywords = [x.strip() for x in cmds.split(',')]
+        # id in social_table, assigned by _register_social
+        self.sid = None
+        # message field name -> renderer from _build_renderer, filled on first use
+        self._templates = { }
+
+    def render(self, field, modifier):
+        """Render one of the message fields, e.g. "to_char_tgt", for a use"""
+        renderer = self._templates.get(field)
+        if renderer is None:
+            renderer = self._templates[field] = _build_renderer(getattr(self, field) or "")
+        # most messages have no $x/$X at all and go out unchanged
+        if type(renderer) is str:
+            return renderer
+        return renderer(modifier, self.adjective, self.adverb)
 
     def store(self):
         set = storage.StorageSet()
-        set.storeString("cmds",           self.cmds)
-        set.storeString("to_char_notgt",  self.to_char_notgt)
-        set.storeString("to_room_notgt",  self.to_room_notgt)
-        set.storeString("to_char_self",   self.to_char_self)
-        set.storeString("to_room_self",   self.to_room_self)
-        set.storeString("to_char_tgt",    self.to_char_tgt)
-        set.storeString("to_vict_tgt",    self.to_vict_tgt)
-        set.storeString("to_room_tgt",    self.to_room_tgt)
-        set.storeString("adjective",      self.adjective)
-        set.storeString("adverb",         self.adverb)
-        set.storeString("require_tgt",    self.require_tgt)
-        set.storeString("min_pos",        self.min_pos)
-        set.storeString("max_pos",        self.max_pos)
+        store = set.storeString
+        store("cmds",           self.get_cmds())
+        store("to_char_notgt",  self.to_char_notgt)
+        store("to_room_notgt",  self.to_room_notgt)
+        store("to_char_self",   self.to_char_self)
+        store("to_room_self",   self.to_room_self)
+        store("to_char_tgt",    self.to_char_tgt)
+        store("to_vict_tgt",    self.to_vict_tgt)
+        store("to_room_tgt",    self.to_room_tgt)
+        store("adjective",      self.adjective)
+        store("adverb",         self.adverb)
+        store("require_tgt",    self.require_tgt)
+        store("min_pos",        self.min_pos)
+        store("max_pos",        self.max_pos)
         return set
 
-    def get_cmds(self): return self.cmds
+    def get_cmds(self): return ','.join(self.keywords)
     def get_to_char_notgt(self): return self.to_char_notgt
     def get_to_char_self(self): return self.to_char_self
     def get_to_char_tgt(self): return self.to_char_tgt
@@ -150,28 +228,35 @@ class Social:
     def get_max_pos(self): return self.max_pos
 
     def set_cmds(self, val):
-        self.cmds = val
-        return self.cmds
+        self.keywords = [x.strip() for x in val.split(',')]
+        return self.get_cmds()
     def set_to_char_notgt(self, val):
         self.to_char_notgt = val
+        self._templates.pop("to_char_notgt", None)
         return self.to_char_notgt
     def set_to_char_self(self, val):
         self.to_char_self = val
+        self._templates.pop("to_char_self", None)
         return self.to_char_self
     def set_to_char_tgt(self, val):
         self.to_char_tgt = val
+        self._templates.pop("to_char_tgt", None)
         return self.to_char_tgt
     def set_to_room_notgt(self, val):
         self.to_room_notgt = val
+        self._templates.pop("to_room_notgt", None)
         return self.to_room_notgt
     def set_to_room_self(self, val):
         self.to_room_self = val
+        self._templates.pop("to_room_self", None)
         return self.to_room_self
     def set_to_room_tgt(self, val):
         self.to_room_tgt = val
+        self._templates.pop("to_room_tgt", None)
         return self.to_room_tgt
     def set_to_vict_tgt(self, val):
         self.to_vict_tgt = val
+        self._templates.pop("to_vict_tgt", None)
         return self.to_vict_tgt
     def set_adverb(self, val):
         self.adverb = val
@@ -192,99 +277,114 @@ class Social:
             self.max_pos = val
         return self.max_pos
 
+# Position checks for social commands. A min_pos check wins over a max_pos one.
+_POS_CHECKS = {
+    ("min", "sitting"):  chk_conscious,
+    ("min", "standing"): chk_can_move,
+    ("max", "standing"): chk_grounded,
+    ("max", "sitting"):  chk_supine,
+}
+
+def _apply_pos_checks(cmd, social_data):
+    """Add the position check a social's min/max positions call for to cmd"""
+    fn = (_POS_CHECKS.get(("min", social_data.get_min_pos())) or
+          _POS_CHECKS.get(("max", social_data.get_max_pos())))
+    if fn is not None:
+        mudsys.add_cmd_check(cmd, fn)
+
+def _register_social(social_data):
+    """Give a social an id in social_table if it doesn't have one yet"""
+    global _last_social_id
+    if social_data.sid is None:
+        _last_social_id += 1
+        social_data.sid = _last_social_id
+    social_table[social_data.sid] = social_data
+    return social_data.sid
+
 def link_social(new_cmd, old_cmd, save=True):
-    if old_cmd in socials.keys():
+    global _socials_display
+    if old_cmd in socials:
         unlink_social(new_cmd, save)
     social_data = get_social(old_cmd)
+    if social_data is None:
+        return
 
-    cmds = social_data.get_cmds()
-    keywords = [x.strip() for x in cmds.split(',')]
-    keywords.append(new_cmd)
-
-    # relink all the individual mappings
-    new_cmds = ','.join(keywords)
-    for k in keywords:
-        socials[k] = new_cmds
-
-    # set the new hash, delete the old one and add the new
-    social_data.set_cmds(new_cmds)
-    del social_table[cmds]
-    social_table[new_cmds] = social_data
+    social_data.keywords.append(new_cmd)
+    socials[new_cmd] = social_data.sid
+    _socials_display = None
 
     # add the command to the system
     add_cmd(new_cmd, None, cmd_social, "player", False)
-    # this needs to be rewritten
-    if social_data.get_min_pos() == "sitting":
-        mudsys.add_cmd_check(new_cmd, chk_conscious)
-    elif social_data.get_min_pos() == "standing":
-        mudsys.add_cmd_check(new_cmd, chk_can_move)
-    elif social_data.get_max_pos() == "standing":
-        mudsys.add_cmd_check(new_cmd, chk_grounded)
-    elif social_data.get_max_pos() == "sitting":
-        mudsys.add_cmd_check(new_cmd, chk_supine)
+    _apply_pos_checks(new_cmd, social_data)
 
     if save is True:
         save_socials()
 
 
 def unlink_social(social_cmd, save=True):
-    if social_cmd not in socials.keys():
+    global _socials_display
+    if social_cmd not in socials:
         return
 
-    social_link = socials[social_cmd]
-    if social_link in social_table.keys():
-        social_data = social_table.pop(social_link)
-
-        if social_data is not None:
-            cmds = social_data.get_cmds()
-            result = [x.strip() for x in cmds.split(',')]
-            # remove the original cmd from the command list
-            result.remove(social_cmd)
-            remove_cmd(social_cmd)
-            # if there are still commands left re-add
-            if len(result) > 0:
-                social_data.set_cmds(','.join(result))
-                social_table[social_link] = social_data
-            else:
-                del socials[social_cmd]  # Fixed: was trying to use as index
+    sid = socials.pop(social_cmd)
+    _socials_display = None
+    social_data = social_table.get(sid)
+    if social_data is not None:
+        # remove the original cmd from the command list
+        if social_cmd in social_data.keywords:
+            social_data.keywords.remove(social_cmd)
+        remove_cmd(social_cmd)
+        # the social goes away with its last command
+        if len(social_data.keywords) == 0:
+            del social_table[sid]
 
         if save is True:
             save_socials()
 
 def add_social(social_data, save=True):
-    cmds = social_data.get_cmds()
-    result = [x.strip() for x in cmds.split(',')]
-    for res in result:
-        unlink_social(res)
+    global _socials_display
+    keywords = list(social_data.keywords)
+    for res in keywords:
+        if get_social(res) is not social_data:
+            unlink_social(res)
         add_cmd(res, None, cmd_social, "player", False)
-        if social_data.get_min_pos() == "sitting":
-            mudsys.add_cmd_check(res, chk_conscious)
-        elif social_data.get_min_pos() == "standing":
-            mudsys.add_cmd_check(res, chk_can_move)
-        elif social_data.get_max_pos() == "standing":
-            mudsys.add_cmd_check(res, chk_grounded)
-        elif social_data.get_max_pos() == "sitting":
-            mudsys.add_cmd_check(res, chk_supine)
-        socials[res] = cmds
-    social_table[cmds] = social_data
+        _apply_pos_checks(res, social_data)
+    social_data.keywords = keywords
+    sid = _register_social(social_data)
+    for res in keywords:
+        socials[res] = sid
+    _socials_display = None
     if save:
         save_socials()
 
 
 def get_social(social):
-    if social in socials:
-        return social_table[socials[social]]
+    sid = socials.get(social)
+    if sid is not None:
+        return social_table.get(sid)
     return None
 
 
 def save_socials():
+    """Mark the socials file out of date; flush_socials writes it"""
+    global _dirty
+    _dirty = True
+
+
+def flush_socials():
+    """Write the socials file if anything changed since the last write"""
+    global _dirty
+    if not _dirty:
+        return
+    _dirty = False
+
     set = storage.StorageSet()
     socials = storage.StorageList()
     set.storeList("socials", socials)
 
-    for cmd, data in social_table.items():  # Fixed: iteritems() -> items()
-        one_set = data.store()
-        socials.add(one_set)
+    add = socials.add
+    for data in social_table.values():
+        add(data.store())
 
     set.write(socials_file)
     set.close()
@@ -292,28 +392,27 @@ def save_socials():
 
 
 def save_social(social):
+    # called when a builder leaves socedit, so write right away
     save_socials()
+    flush_socials()
     return
 
+def flush_socials_hook(info):
+    """Heartbeat/shutdown hook that writes pending social edits"""
+    flush_socials()
+
 def load_socials():
+    global _socials_display
     storeSet = storage.StorageSet(socials_file)
     for social_set in storeSet.readList("socials").sets():
         social_data = Social(storeSet=social_set)
-        cmds = social_data.get_cmds()
-        result = [x.strip() for x in cmds.split(',')]
-        social_table[cmds] = social_data
-        for res in result:
+        sid = _register_social(social_data)
+        for res in social_data.keywords:
             add_cmd(res, None, cmd_social, "player", False)
-            if social_data.get_min_pos() == "sitting":
-                mudsys.add_cmd_check(res, chk_conscious)
-            elif social_data.get_min_pos() == "standing":
-                mudsys.add_cmd_check(res, chk_can_move)
-            elif social_data.get_max_pos() == "standing":
-                mudsys.add_cmd_check(res, chk_grounded)
-            elif social_data.get_max_pos() == "sitting":
-                mudsys.add_cmd_check(res, chk_supine)
-            socials[res] = cmds
+            _apply_pos_checks(res, social_data)
+            socials[res] = sid
     storeSet.close()
+    _socials_display = None
     return
 
 def cmd_socials(ch, cmd, arg):
@@ -347,18 +446,12 @@ def cmd_socials(ch, cmd, arg):
     the socials currently available to you. Additionally you can specify a social and see how a
     specific social will look if used, the adverbs, and any synonyms.
     '''
-    buf = [ ]
-    socs = sorted(__socials__.keys())
-    count = 0
-    for soc in socs:
-        count = count + 1
-        buf.append("%-20s" % soc)
-        if count % 4 == 0:
-            ch.send("".join(buf))
-            buf = [ ]
-
-    if count % 4 != 0:
-        ch.send("".join(buf))
+    global _socials_display
+    if _socials_display is None:
+        socs = ["%-20s" % soc for soc in sorted(socials)]
+        _socials_display = "\r\n".join("".join(socs[i:i + 4]) for i in range(0, len(socs), 4))
+    if _socials_display:
+        ch.send(_socials_display)
 
 
 def cmd_soclink(ch, cmd, arg):
@@ -389,25 +482,6 @@ def cmd_socunlink(ch, cmd, arg):
     ch.send("The %s social was unlinked." % arg)
     mud.log_string("%s unlinked the social %s." % (ch.name, arg))
 
-def process_social_message(msg, modifier, data):
-    """Helper function to process social message with proper $X/$x replacement"""
-    if not msg:
-        return msg
-    
-    # Replace $x with adjective (always from social data)
-    if "$x" in msg and data.get_adjective():
-        msg = msg.replace("$x", data.get_adjective())
-    
-    # Replace $X with modifier (user provided) or default adverb
-    if "$X" in msg:
-        if modifier:
-            msg = msg.replace("$X", modifier)
-        elif data.get_adverb():
-            msg = msg.replace("$X", data.get_adverb())
-    
-    return msg
-
-
 # One generic command for handling socials. Does table lookup on all of
 # the existing socials and executes the proper one.
 def cmd_social(ch, cmd, arg):
@@ -418,19 +492,19 @@ def cmd_social(ch, cmd, arg):
     #   1. Explicit: "modifier at target" (e.g., "grin evilly at mysty")
     #   2. Implicit: "modifier target" (e.g., "grin evilly mysty")
     
-    args = arg.split(" at ", 1)
-    has_explicit_at = len(args) >= 2
+    head, sep, tail = arg.partition(" at ")
+    has_explicit_at = bool(sep)
     
     if has_explicit_at:
         # Format: "modifier at target"
         # Everything before " at " becomes the modifier
         # Everything after " at " becomes the target
-        modifier = args[0].strip()
-        target_name = args[1].strip()
+        modifier = head.strip()
+        target_name = tail.strip()
     else:
         # Format: "modifier target" or single word or empty
         # Parse by splitting on spaces and using positional logic
-        words = arg.strip().split()
+        words = arg.split()
         
         if len(words) >= 2:
             # Multiple words: "very evilly mysty" -> modifier="very evilly", target="mysty"
@@ -464,9 +538,9 @@ def cmd_social(ch, cmd, arg):
             
         # If we found no target, handle fallback logic
         if tgt is None and not has_explicit_at:
-            if len(arg.strip().split()) == 1:
+            if len(words) == 1:
                 # Single word that wasn't found as target - treat as modifier
-                modifier = arg.strip()
+                modifier = words[0]
                 target_name = ""
             # For multi-word cases, modifier and target_name are already set correctly
         elif tgt is not None and type != "char":
@@ -476,43 +550,44 @@ def cmd_social(ch, cmd, arg):
 
         # Set default modifier if no modifier provided but adverb exists
         # This happens AFTER fallback logic so user modifiers take precedence
-        if not modifier and data.get_adverb():
-            modifier = data.get_adverb()
+        # (fields are read directly; this is the hot path for every emote)
+        if not modifier and data.adverb:
+            modifier = data.adverb
 
         # No target was supplied, the emote is to ourselves.
         if tgt is None:
-            if data.get_to_char_notgt():
-                msg = process_social_message(data.get_to_char_notgt(), modifier, data)
+            if data.to_char_notgt:
+                msg = data.render("to_char_notgt", modifier)
                 mud.message(ch, None, None, None, True, "to_char", msg)
-            if data.get_to_room_notgt():
-                msg = process_social_message(data.get_to_room_notgt(), modifier, data)
+            if data.to_room_notgt:
+                msg = data.render("to_room_notgt", modifier)
                 mud.message(ch, None, None, None, True, "to_room", msg)
             return
         # a target was supplied and it is us
         elif ch == tgt:
-            if data.get_to_char_self():
-                msg = process_social_message(data.get_to_char_self(), modifier, data)
+            if data.to_char_self:
+                msg = data.render("to_char_self", modifier)
                 mud.message(ch, None, None, None, True, "to_char", msg)
-            elif data.get_to_char_notgt():
-                msg = process_social_message(data.get_to_char_notgt(), modifier, data)
+            elif data.to_char_notgt:
+                msg = data.render("to_char_notgt", modifier)
                 mud.message(ch, None, None, None, True, "to_char", msg)
-            if data.get_to_room_self():
-                msg = process_social_message(data.get_to_room_self(), modifier, data)
+            if data.to_room_self:
+                msg = data.render("to_room_self", modifier)
                 mud.message(ch, None, None, None, True, "to_room", msg)
-            elif data.get_to_room_notgt():
-                msg = process_social_message(data.get_to_room_notgt(), modifier, data)
+            elif data.to_room_notgt:
+                msg = data.render("to_room_notgt", modifier)
                 mud.message(ch, None, None, None, True, "to_room", msg)
             return
         # a target was supplied and it is not us
         else:
-            if data.get_to_char_tgt():
-                msg = process_social_message(data.get_to_char_tgt(), modifier, data)
+            if data.to_char_tgt:
+                msg = data.render("to_char_tgt", modifier)
                 mud.message(ch, tgt, None, None, True, "to_char", msg)
-            if data.get_to_vict_tgt():
-                msg = process_social_message(data.get_to_vict_tgt(), modifier, data)
+            if data.to_vict_tgt:
+                msg = data.render("to_vict_tgt", modifier)
                 mud.message(ch, tgt, None, None, True, "to_vict", msg)
-            if data.get_to_room_tgt():
-                msg = process_social_message(data.get_to_room_tgt(), modifier, data)
+            if data.to_room_tgt:
+                msg = data.render("to_room_tgt", modifier)
                 mud.message(ch, tgt, None, None, True, "to_room", msg)
     else:
         mud.log_string("ERROR: %s tried social, %s, but no such social exists!" % (ch.name, cmd))
@@ -520,6 +595,8 @@ def cmd_social(ch, cmd, arg):
             
 
 load_socials()
+hooks.add("heartbeat", flush_socials_hook)
+hooks.add("shutdown", flush_socials_hook)
 add_cmd("socials", None, cmd_socials, "player", False)
 add_cmd("socunlink", None, cmd_socunlink, "builder", False)
 add_cmd("soclink", None, cmd_soclink, "builder", False)
\ No newline at end of file
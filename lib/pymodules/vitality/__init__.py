@@ -6,56 +6,33 @@ Manages character HP, SP, and EP based on attributes.
 DEBUGGING: Disabling modules one by one to find the crash source
 """
 
-import os
 import importlib
 import mud
 import auxiliary
 
 mud.log_string("Vitality module: Starting initialization...")
 
-__all__ = []
+# Submodules in import order
+_MODULES = (
+    'vitality_core',
+    'injury_aux',
+    'vitality_damage',
+    'vitality_regen',
+    'death_handler',
+    'vitality_injury',
+    'injury_penalties',
+    'commands',
+)
 
-# Compile a list of all our modules
-for fl in os.listdir(__path__[0]):
-    if fl.endswith(".py") and not (fl == "__init__.py" or fl.startswith(".")):
-        __all__.append(fl[:-3])
-
-# Import all of our modules
-__all__ = []
+__all__ = list(_MODULES)
 
 try:
-    # Import core modules - TEST ONE AT A TIME
-    mud.log_string("Vitality: About to import vitality_core...")
-    from . import vitality_core
-    mud.log_string("Vitality: vitality_core imported successfully")
-    
-    mud.log_string("Vitality: About to import injury_aux...")
-    from . import injury_aux
-    mud.log_string("Vitality: injury_aux imported successfully")
-    
-    mud.log_string("Vitality: About to import vitality_damage...")
-    from . import vitality_damage
-    mud.log_string("Vitality: vitality_damage imported successfully")
-    
-    mud.log_string("Vitality: About to import vitality_regen...")
-    from . import vitality_regen
-    mud.log_string("Vitality: vitality_regen imported successfully")
-    
-    mud.log_string("Vitality: About to import death_handler...")
-    from . import death_handler
-    mud.log_string("Vitality: death_handler imported successfully")
-    
-    mud.log_string("Vitality: About to import vitality_injury...")
-    from . import vitality_injury
-    mud.log_string("Vitality: vitality_injury imported successfully")
-    
-    mud.log_string("Vitality: About to import injury_penalties...")
-    from . import injury_penalties
-    mud.log_string("Vitality: injury_penalties imported successfully")
+    for module in _MODULES:
+        mud.log_string(f"Vitality: Importing {module}...")
+        importlib.import_module('.' + module, package=__name__)
     
-    mud.log_string("Vitality: About to import commands...")
-    from . import commands
-    mud.log_string("Vitality: commands imported successfully")
+    from . import vitality_core, injury_aux, vitality_regen, death_handler
+    from . import vitality_injury, commands
     
     mud.log_string("Vitality: Core modules imported successfully")
     
@@ -6,6 +6,15 @@ from . import vitality_damage
 from . import vitality_injury
 from . import death_handler
 
+# heal type -> (stat, max stat) pairs it restores
+_HEAL_STATS = {
+    "hp": (("hp", "max_hp"),),
+    "sp": (("sp", "max_sp"),),
+    "ep": (("ep", "max_ep"),),
+}
+_HEAL_STATS["all"] = _HEAL_STATS["hp"] + _HEAL_STATS["sp"] + _HEAL_STATS["ep"]
+_WOUND_HEAL_TYPES = frozenset(("wounds", "all"))
+
 def cmd_damage(ch, cmd, arg):
     """
     Admin command to damage a mob for testing.
@@ -32,13 +41,12 @@ def cmd_damage(ch, cmd, arg):
         return
     
     # Find the target mob in the room
-    target = None
-    for char in ch.room.chars:
-        if target_name.lower() in char.name.lower():
-            target = char
-            break
+    try:
+        target, target_type = mud.generic_find(ch, target_name, "char", "room", False)
+    except UnicodeDecodeError:
+        target, target_type = None, None
     
-    if not target:
+    if not target or target_type != "char":
         ch.send("That target is not here.")
         return
     
@@ -97,12 +105,11 @@ def cmd_heal(ch, cmd, arg):
         target = ch
     else:
         try:
-            target = ch.room.get_character(target_name)
-        except:
-            ch.send("Target '%s' not found." % args[0])
-            return
+            target, target_type = mud.generic_find(ch, target_name, "char", "room", False)
+        except UnicodeDecodeError:
+            target, target_type = None, None
         
-        if not target:
+        if not target or target_type != "char":
             ch.send("Target '%s' not found." % args[0])
             return
     
@@ -122,33 +129,25 @@ def cmd_heal(ch, cmd, arg):
         return
     
     # Process heal command
-    healed_hp = 0
-    healed_sp = 0
-    healed_ep = 0
+    healed = {"hp": 0, "sp": 0, "ep": 0}
     wounds_removed = 0
     
-    if heal_type in ["hp", "all"]:
-        old_hp = vit_aux.hp
-        vit_aux.hp = min(vit_aux.max_hp, vit_aux.hp + heal_amount)
-        healed_hp = vit_aux.hp - old_hp
+    for stat, max_stat in _HEAL_STATS.get(heal_type, ()):
+        old_value = getattr(vit_aux, stat)
+        setattr(vit_aux, stat, min(getattr(vit_aux, max_stat), old_value + heal_amount))
+        healed[stat] = getattr(vit_aux, stat) - old_value
     
-    if heal_type in ["sp", "all"]:
-        old_sp = vit_aux.sp
-        vit_aux.sp = min(vit_aux.max_sp, vit_aux.sp + heal_amount)
-        healed_sp = vit_aux.sp - old_sp
-    
-    if heal_type in ["ep", "all"]:
-        old_ep = vit_aux.ep
-        vit_aux.ep = min(vit_aux.max_ep, vit_aux.ep + heal_amount)
-        healed_ep = vit_aux.ep - old_ep
-    
-    if heal_type in ["wounds", "all"]:
+    if heal_type in _WOUND_HEAL_TYPES:
         # Remove all wounds
         injury_aux = target.getAuxiliary("injury_data")
         if injury_aux and hasattr(injury_aux, 'wounds'):
             wounds_removed = len(injury_aux.wounds)
             injury_aux.wounds = {}
     
+    healed_hp = healed["hp"]
+    healed_sp = healed["sp"]
+    healed_ep = healed["ep"]
+    
     # Build response message
     if heal_type == "all":
         ch.send("Fully healed %s:" % target.name)
@@ -187,8 +186,13 @@ def cmd_checkdeath(ch, cmd, arg):
     else:
         ch.send("No vitality data.")
 
+# Admin commands: (name, function)
+_ADMIN_CMDS = (
+    ("damage", cmd_damage),
+    ("checkdeath", cmd_checkdeath),
+    ("heal", cmd_heal),
+)
+
 def register_commands():
-    # Add to register_commands():
-    mudsys.add_cmd("damage", None, cmd_damage, "admin", False)
-    mudsys.add_cmd("checkdeath", None, cmd_checkdeath, "admin", False)
-    mudsys.add_cmd("heal", None, cmd_heal, "admin", False)
\ No newline at end of file
+    for name, func in _ADMIN_CMDS:
+        mudsys.add_cmd(name, None, func, "admin", False)
\ No newline at end of file
@@ -4,6 +4,7 @@ Death Handler Module
 Manages character death, respawn, and death messages.
 """
 
+import re
 import mud
 import hooks
 import mudsys
@@ -13,11 +14,22 @@ from . import vitality_core
 # Configuration
 RESPAWN_DELAY = 5  # Heartbeats before respawn
 RESPAWN_ROOM = "grandaltar@gtyr"  # Default respawn location
+LOG_DEATH_DEBUG = False  # Log each stage of death handling
+
+# uid -> dead character waiting on the respawn timer
+_DEAD_CHARS = {}
+
+# Death message template -> %-format string with named placeholders
+_DEATH_FORMATS = {}
+_DEATH_TOKEN_RE = re.compile(r"%([mnt]?)")
 
 
 def setup_death_hooks():
     """Register death handler to listen for on_death hook"""
     hooks.add("on_death", handle_death)
+    hooks.add("heartbeat", respawn_tick_hook)
+    hooks.add("char_to_game", char_to_game_hook)
+    hooks.add("char_from_game", char_from_game_hook)
     mud.log_string("Death handler registered for on_death hook")
 
 
@@ -27,15 +39,21 @@ def handle_death(info_string):
     Called when on_death hook fires (HP <= 0).
     
     Args:
-        info_string: Hook info string formatted by build_info (parsed by parse_info)
+        info_string: Hook info string formatted by build_info (parsed by parse_info),
+            or the already-unpacked (victim_ch, source, damage_type) tuple when
+            called directly from Python
     """
     try:
-        # Parse the hook info string back into objects
-        # Format was: "ch ch str" -> (victim_ch, source_ch, damage_type_str)
-        parsed = hooks.parse_info(info_string)
+        if type(info_string) is tuple:
+            # Direct call: nothing to serialize or re-parse
+            parsed = info_string
+        else:
+            # Parse the hook info string back into objects
+            # Format was: "ch ch str" -> (victim_ch, source_ch, damage_type_str)
+            parsed = hooks.parse_info(info_string)
         
         if len(parsed) < 3:
-            mud.log_string("ERROR: Death hook received invalid info: %s" % info_string)
+            mud.log_string("ERROR: Death hook received invalid info: %s" % (info_string,))
             return
         
         ch = parsed[0]
@@ -51,7 +69,8 @@ def handle_death(info_string):
         mud.log_string("ERROR: Death handler received invalid character object")
         return
     
-    mud.log_string("DEATH HANDLER: Processing death for %s" % ch.name)
+    if LOG_DEATH_DEBUG:
+        mud.log_string("DEATH HANDLER: Processing death for %s" % ch.name)
     
     # Get vitality data
     vit_aux = ch.getAuxiliary("vitality_data")
@@ -63,36 +82,35 @@ def handle_death(info_string):
     vit_aux.is_dead = True
     vit_aux.death_count = RESPAWN_DELAY
     
-    # Get death messages from the character (or use defaults)
+    # Get death message from the character (or use default) and send it
     death_msg_self = get_death_message(ch, "death_msg_self", "%m is slain!")
-    death_msg_room = get_death_message(ch, "death_msg_room", "%n has slain %m!")
-    
-    # Format messages
     formatted_self = format_death_message(death_msg_self, ch, source)
-    formatted_room = format_death_message(death_msg_room, ch, source)
-    
-    # Send death messages
     if hasattr(ch, 'send'):
         ch.send("\n{r" + formatted_self + "{n\n")
     
-    # Send to room (everyone except the dead character)
-    if hasattr(ch, 'room') and ch.room and hasattr(ch.room, 'chars'):
-        for other in ch.room.chars:
-            if other != ch and hasattr(other, 'send'):
-                other.send("{r" + formatted_room + "{n")
+    # Send to room (everyone except the dead character); skip building
+    # the message when the victim died alone
+    room = ch.room if hasattr(ch, 'room') else None
+    chars = room.chars if room and hasattr(room, 'chars') else ()
+    if len(chars) > 1:
+        death_msg_room = get_death_message(ch, "death_msg_room", "%n has slain %m!")
+        room_msg = "{r" + format_death_message(death_msg_room, ch, source) + "{n"
+        for other in chars:
+            if other != ch:
+                other.send(room_msg)
     
-    mud.log_string("DEATH: %s killed by %s (%s damage)" % 
-                   (ch.name, get_source_name(source), damage_type))
+    death_log = "DEATH: %s killed by %s (%s damage)" % (ch.name, get_source_name(source), damage_type)
     
     # Handle NPCs vs Players differently
     if ch.is_npc:
         # NPCs are simply extracted - zone resets will handle respawning
-        mud.log_string("DEATH: %s (NPC) extracted. Zone reset will respawn." % ch.name)
+        mud.log_string(death_log + "; NPC extracted. Zone reset will respawn.")
         mud.extract(ch)
     else:
         # Players respawn after a delay
         vit_aux.death_count = RESPAWN_DELAY
-        mud.log_string("DEATH: %s (Player) will respawn in %d heartbeats" % (ch.name, RESPAWN_DELAY))
+        _DEAD_CHARS[ch.uid] = ch
+        mud.log_string(death_log + "; player will respawn in %d heartbeats" % RESPAWN_DELAY)
         #TODO: Actually kill players and respawn them once the ghost system is implemented.
 
 def get_death_message(ch, attr_name, default):
@@ -107,10 +125,7 @@ def get_death_message(ch, attr_name, default):
     Returns:
         str: Death message
     """
-    try:
-        return getattr(ch, attr_name, default)
-    except:
-        return default
+    return getattr(ch, attr_name, default)
 
 
 def format_death_message(message, victim, killer):
@@ -130,11 +145,14 @@ def format_death_message(message, victim, killer):
     Returns:
         str: Formatted message
     """
-    result = message
-    result = result.replace("%m", victim.name)
-    result = result.replace("%n", get_source_name(killer))
-    result = result.replace("%t", victim.name)
-    return result
+    fmt = _DEATH_FORMATS.get(message)
+    if fmt is None:
+        # Escape stray % signs so the whole template fills in one pass
+        fmt = _DEATH_TOKEN_RE.sub(
+            lambda m: "%%(%s)s" % m.group(1) if m.group(1) else "%%", message)
+        _DEATH_FORMATS[message] = fmt
+    
+    return fmt % {"m": victim.name, "n": get_source_name(killer), "t": victim.name}
 
 
 def get_source_name(source):
@@ -150,27 +168,30 @@ def get_source_name(source):
     if source is None:
         return "an unknown force"
     
-    # Try to get name attribute (works for chars and objects)
-    try:
-        return source.name
-    except:
-        pass
-    
     # If it's a string, return it
     if isinstance(source, str):
         return source
     
+    # Use the name attribute if there is one (works for chars and objects)
+    name = getattr(source, 'name', None)
+    if name is not None:
+        return name
+    
     return "something"
 
 
 def check_respawn(ch):
     """
-    Check if a dead character should respawn.
-    Called from character heartbeat.
+    Queue a dead character for the respawn timer.
+    handle_death queues new deaths itself; char_to_game_hook calls this for
+    players entering the game, who may have been saved while dead.
     
     Args:
         ch: Character to check
     """
+    if ch.uid in _DEAD_CHARS:
+        return
+    
     vit_aux = ch.getAuxiliary("vitality_data")
     if not vit_aux:
         return
@@ -179,12 +200,44 @@ def check_respawn(ch):
     if not vit_aux.is_dead:
         return
     
-    # Decrement counter
-    vit_aux.death_count -= 1
+    _DEAD_CHARS[ch.uid] = ch
+
+
+def char_to_game_hook(info):
+    """Queue players who log in dead so their respawn timer resumes"""
+    ch, = hooks.parse_info(info)
+    if ch and not ch.is_npc:
+        check_respawn(ch)
+
+
+def char_from_game_hook(info):
+    """Stop counting down for characters leaving the game"""
+    ch, = hooks.parse_info(info)
+    if ch:
+        _DEAD_CHARS.pop(ch.uid, None)
+
+
+def respawn_tick_hook(info):
+    """
+    Count down the dead and respawn those whose timer has run out.
+    Called once per heartbeat; only dead characters are visited.
+    """
+    if not _DEAD_CHARS:
+        return
     
-    # Time to respawn?
-    if vit_aux.death_count <= 0:
-        respawn_character(ch)
+    for uid, ch in list(_DEAD_CHARS.items()):
+        vit_aux = ch.getAuxiliary("vitality_data")
+        if not vit_aux or not vit_aux.is_dead:
+            del _DEAD_CHARS[uid]
+            continue
+        
+        # Decrement counter
+        vit_aux.death_count -= 1
+        
+        # Time to respawn?
+        if vit_aux.death_count <= 0:
+            del _DEAD_CHARS[uid]
+            respawn_character(ch)
 
 
 def respawn_character(ch):
@@ -218,10 +271,12 @@ def respawn_character(ch):
                 ch.act("look")
             
             # Announce arrival
-            if hasattr(ch.room, 'chars'):
-                for other in ch.room.chars:
-                    if other != ch and hasattr(other, 'send'):
-                        other.send("%s materializes in a flash of light!" % ch.name)
+            chars = ch.room.chars if hasattr(ch.room, 'chars') else ()
+            if len(chars) > 1:
+                arrival_msg = "%s materializes in a flash of light!" % ch.name
+                for other in chars:
+                    if other != ch:
+                        other.send(arrival_msg)
         else:
             mud.log_string("ERROR: Respawn room %s not found!" % RESPAWN_ROOM)
     except Exception as e:
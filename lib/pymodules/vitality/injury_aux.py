@@ -8,6 +8,30 @@ Stores wounds, scars, and injury progression tracking.
 import mud
 import storage
 import json
+from . import injury_penalties
+
+# Prefer orjson for the wound/scar blobs if it is installed
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _dumps(data):
+    """Encode wounds/scars to a JSON string."""
+    if not data:
+        return "{}"
+    if HAS_ORJSON:
+        return orjson.dumps(data).decode("utf-8")
+    return json.dumps(data, separators=(",", ":"))
+
+
+def _loads(text):
+    """Decode a JSON string written by _dumps (or older json.dumps)."""
+    if HAS_ORJSON:
+        return orjson.loads(text)
+    return json.loads(text)
 
 
 class InjuryAuxData:
@@ -21,6 +45,8 @@ class InjuryAuxData:
     
     def __init__(self, set=None):
         """Initialize with default values or load from storage set."""
+        self._penalty_cache = None        # skill -> total scar penalty
+        self._scars_json = None           # encoded scars, reused by store()
         if set is None:
             # Default values
             self.wounds = {}              # body_part -> wound dict
@@ -35,7 +61,7 @@ class InjuryAuxData:
             try:
                 if set.contains("wounds_json"):
                     wounds_json = set.readString("wounds_json")
-                    self.wounds = json.loads(wounds_json)
+                    self.wounds = _loads(wounds_json)
             except Exception as e:
                 mud.log_string(f"ERROR loading wounds: {str(e)}")
                 self.wounds = {}
@@ -45,7 +71,8 @@ class InjuryAuxData:
             try:
                 if set.contains("scars_json"):
                     scars_json = set.readString("scars_json")
-                    self.scars = json.loads(scars_json)
+                    self.scars = _loads(scars_json)
+                    self._scars_json = scars_json
             except Exception as e:
                 mud.log_string(f"ERROR loading scars: {str(e)}")
                 self.scars = {}
@@ -54,17 +81,49 @@ class InjuryAuxData:
         """Copy this data to another InjuryAuxData instance."""
         other.wounds = {}
         for body_part, wound in self.wounds.items():
-            other.wounds[body_part] = {
-                "type": wound["type"],
-                "severity": wound["severity"],
-                "status": wound["status"].copy() if isinstance(wound["status"], list) else [],
-                "age": wound["age"],
-                "scar_created": wound["scar_created"]
-            }
+            wound = wound.copy()
+            status = wound.get("status")
+            wound["status"] = status[:] if isinstance(status, list) else []
+            other.wounds[body_part] = wound
         
         other.scars = self.scars.copy()
+        other._penalty_cache = self._penalty_cache
+        other._scars_json = self._scars_json
         other.progression_counter = self.progression_counter
     
+    @property
+    def scars(self):
+        """body_part -> scar severity. Use set_scar() to change entries."""
+        return self._scars
+    
+    @scars.setter
+    def scars(self, scars):
+        self._scars = scars
+        self._penalty_cache = None
+        self._scars_json = None
+    
+    def set_scar(self, body_part, severity):
+        """Set the scar severity on a body part."""
+        self._scars[body_part] = severity
+        self._penalty_cache = None
+        self._scars_json = None
+    
+    def invalidate_penalties(self):
+        """Drop cached scar penalties and encoding after editing scars in place."""
+        self._penalty_cache = None
+        self._scars_json = None
+    
+    def total_penalties(self):
+        """
+        Get cumulative skill penalties from all scars.
+        
+        Returns:
+            dict: Skill -> penalty mapping (cached, do not modify)
+        """
+        if self._penalty_cache is None:
+            self._penalty_cache = injury_penalties.get_penalties_bulk(self._scars.items())
+        return self._penalty_cache
+    
     def copy(self):
         """Create a copy of this auxiliary data."""
         new_aux = InjuryAuxData()
@@ -80,15 +139,16 @@ class InjuryAuxData:
         
         # Store wounds as JSON string
         try:
-            wounds_json = json.dumps(self.wounds)
+            wounds_json = _dumps(self.wounds)
             set.storeString("wounds_json", wounds_json)
         except Exception as e:
             mud.log_string(f"ERROR storing wounds: {str(e)}")
         
         # Store scars as JSON string
         try:
-            scars_json = json.dumps(self.scars)
-            set.storeString("scars_json", scars_json)
+            if self._scars_json is None:
+                self._scars_json = _dumps(self._scars)
+            set.storeString("scars_json", self._scars_json)
         except Exception as e:
             mud.log_string(f"ERROR storing scars: {str(e)}")
         
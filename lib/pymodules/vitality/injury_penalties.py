@@ -9,6 +9,10 @@ Severity levels: 1=insignificant, 2=negligible, 3=minor, 4=small,
                  5=moderate, 6=large, 7=severe, 8=critical
 """
 
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+
 # Define penalties per body part and severity
 # Format: body_part -> {severity: {skill: penalty, ...}, ...}
 PENALTY_MAP = {
@@ -208,6 +212,53 @@ PENALTY_MAP = {
 }
 
 
+# Scar severities are clamped to this range before lookup
+MIN_SEVERITY = 3
+MAX_SEVERITY = 8
+
+# Shared read-only result for parts or severities without penalties
+_EMPTY_PENALTIES = MappingProxyType({})
+
+
+def _build_flat_penalties():
+    """Flatten PENALTY_MAP into (body_part, severity) -> read-only penalties."""
+    flat = {}
+    for body_part, by_severity in PENALTY_MAP.items():
+        body_part = sys.intern(body_part)
+        defined = sorted(by_severity)
+        for severity in range(MIN_SEVERITY, MAX_SEVERITY + 1):
+            # Fill gaps from the nearest lower defined level
+            lower = [sev for sev in defined if sev <= severity]
+            if lower:
+                flat[(body_part, severity)] = MappingProxyType(by_severity[lower[-1]])
+    return flat
+
+
+_FLAT_PENALTIES = _build_flat_penalties()
+
+# Known body part spellings -> interned lowercase canonical name
+_CANONICAL_BP = {}
+for _bp in PENALTY_MAP:
+    _canon = sys.intern(_bp.lower())
+    for _spelling in (_bp, _bp.lower(), _bp.title(), _bp.upper(), _bp.capitalize()):
+        _CANONICAL_BP[_spelling] = _canon
+del _bp, _canon, _spelling
+
+
+def canon(body_part):
+    """
+    Get the canonical (lowercase) form of a body part name.
+    Known body parts come back as the shared interned string.
+    """
+    return _CANONICAL_BP.get(body_part) or body_part.lower()
+
+
+# Same table as (skill, penalty) pairs, for summing many scars at once
+_FLAT_PENALTY_ITEMS = dict((key, tuple(penalties.items()))
+                           for key, penalties in _FLAT_PENALTIES.items())
+
+
+@lru_cache(maxsize=256)
 def get_penalties(body_part, severity):
     """
     Get skill penalties for a scar on a body part at given severity.
@@ -217,16 +268,29 @@ def get_penalties(body_part, severity):
         severity: Scar severity level (3-8)
     
     Returns:
-        dict: Skill -> penalty mapping
+        Mapping: Skill -> penalty mapping (read-only, shared between callers)
     """
-    body_part = body_part.lower()
-    
-    if body_part not in PENALTY_MAP:
-        return {}
+    severity = max(MIN_SEVERITY, min(MAX_SEVERITY, severity))  # Clamp to valid range
+    return _FLAT_PENALTIES.get((canon(body_part), severity), _EMPTY_PENALTIES)
+
+
+def get_penalties_bulk(scars):
+    """
+    Sum skill penalties over many scars.
     
-    severity = max(3, min(8, severity))  # Clamp to valid range
+    Args:
+        scars: Iterable of (body_part, severity) pairs, e.g. scars.items()
     
-    return PENALTY_MAP[body_part].get(severity, {})
+    Returns:
+        dict: Skill -> total penalty mapping
+    """
+    totals = {}
+    get_total = totals.get
+    for body_part, severity in scars:
+        severity = max(MIN_SEVERITY, min(MAX_SEVERITY, severity))
+        for skill, penalty in _FLAT_PENALTY_ITEMS.get((canon(body_part), severity), ()):
+            totals[skill] = get_total(skill, 0) + penalty
+    return totals
 
 
 def get_all_penalties(body_part):
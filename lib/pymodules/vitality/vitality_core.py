@@ -13,6 +13,7 @@ Formulas (from attribute_data.py):
 """
 
 import math
+import operator
 import storage
 import hooks
 import mud
@@ -27,12 +28,29 @@ except ImportError:
     mud.log_string("vitality_core: Attributes module not available")
 
 
+# Log each initialization and recalculation of the pool maximums
+LOG_RECALCULATIONS = False
+
+# vitality type -> (current getter, maximum getter)
+_POOL_GETTERS = {
+    "hp": (operator.attrgetter("hp"), operator.attrgetter("max_hp")),
+    "sp": (operator.attrgetter("sp"), operator.attrgetter("max_sp")),
+    "ep": (operator.attrgetter("ep"), operator.attrgetter("max_ep")),
+}
+
+
 class VitalityAuxData:
     """
     Stores character vitality data (HP, SP, EP).
     Attached to characters as auxiliary data.
     """
     
+    # One instance per character: no per-instance __dict__. __weakref__ is
+    # kept for vitality_damage's aux cache.
+    __slots__ = ("hp", "max_hp", "sp", "max_sp", "ep", "max_ep",
+                 "last_regen_tick", "is_dead", "death_count", "injuries",
+                 "initialized", "__weakref__")
+    
     def __init__(self, set=None):
         """Initialize with default values or load from storage set."""
         if set is None:
@@ -164,14 +182,12 @@ def get_vitality_percent(ch, vitality_type="hp"):
     if not vit_aux:
         return 100.0
     
-    if vitality_type == "hp":
-        return (vit_aux.hp / vit_aux.max_hp * 100.0) if vit_aux.max_hp > 0 else 0.0
-    elif vitality_type == "sp":
-        return (vit_aux.sp / vit_aux.max_sp * 100.0) if vit_aux.max_sp > 0 else 0.0
-    elif vitality_type == "ep":
-        return (vit_aux.ep / vit_aux.max_ep * 100.0) if vit_aux.max_ep > 0 else 0.0
+    getters = _POOL_GETTERS.get(vitality_type)
+    if getters is None:
+        return 0.0
     
-    return 0.0
+    current, maximum = getters[0](vit_aux), getters[1](vit_aux)
+    return (current / maximum * 100.0) if maximum > 0 else 0.0
 
 
 def get_vitality_color(percent):
@@ -288,6 +304,39 @@ def calculate_max_ep(ch):
     return math.ceil(result)
 
 
+def calculate_max_vitality(ch):
+    """
+    Calculate maximum HP, SP, and EP together.
+    Same formulas as calculate_max_hp/sp/ep, but the attribute data is
+    looked up once and shared attributes are read once.
+    
+    Args:
+        ch: Character object
+    
+    Returns:
+        tuple: (max_hp, max_sp, max_ep), each rounded up
+    """
+    if not ATTRIBUTES_AVAILABLE:
+        return (100.0, 100.0, 100.0)
+    
+    attr_aux = attribute_aux.get_attributes(ch)
+    if not attr_aux:
+        return (100.0, 100.0, 100.0)
+    
+    get_attribute = attr_aux.get_attribute
+    stamina = get_attribute("stamina")
+    strength = get_attribute("strength")
+    discipline = get_attribute("discipline")
+    intelligence = get_attribute("intelligence")
+    wisdom = get_attribute("wisdom")
+    reflex = get_attribute("reflex")
+    agility = get_attribute("agility")
+    
+    return (math.ceil(stamina + ((strength + discipline) * 0.125)),
+            math.ceil(intelligence + ((discipline + wisdom) * 0.25)),
+            math.ceil(stamina + ((discipline + reflex + strength + agility) * 0.125)))
+
+
 def recalculate_vitality(ch):
     """
     Recalculate max HP/SP/EP from current attributes.
@@ -306,9 +355,7 @@ def recalculate_vitality(ch):
     old_max_ep = vit_aux.max_ep
     
     # Calculate new maximums
-    new_max_hp = calculate_max_hp(ch)
-    new_max_sp = calculate_max_sp(ch)
-    new_max_ep = calculate_max_ep(ch)
+    new_max_hp, new_max_sp, new_max_ep = calculate_max_vitality(ch)
     
     # Calculate the ratio of change to adjust current values proportionally
     if old_max_hp > 0:
@@ -334,8 +381,9 @@ def recalculate_vitality(ch):
     vit_aux.max_sp = new_max_sp
     vit_aux.max_ep = new_max_ep
     
-    mud.log_string(f"Recalculated vitality for {ch.name}: HP {old_max_hp:.0f}→{new_max_hp:.0f}, "
-                   f"SP {old_max_sp:.0f}→{new_max_sp:.0f}, EP {old_max_ep:.0f}→{new_max_ep:.0f}")
+    if LOG_RECALCULATIONS:
+        mud.log_string(f"Recalculated vitality for {ch.name}: HP {old_max_hp:.0f}→{new_max_hp:.0f}, "
+                       f"SP {old_max_sp:.0f}→{new_max_sp:.0f}, EP {old_max_ep:.0f}→{new_max_ep:.0f}")
 
 
 def initialize_vitality(ch):
@@ -354,9 +402,7 @@ def initialize_vitality(ch):
         return
     
     # Calculate maximums from attributes
-    vit_aux.max_hp = calculate_max_hp(ch)
-    vit_aux.max_sp = calculate_max_sp(ch)
-    vit_aux.max_ep = calculate_max_ep(ch)
+    vit_aux.max_hp, vit_aux.max_sp, vit_aux.max_ep = calculate_max_vitality(ch)
     
     # Set current to max
     vit_aux.hp = vit_aux.max_hp
@@ -365,6 +411,7 @@ def initialize_vitality(ch):
     
     vit_aux.initialized = True
     
-    mud.log_string(f"Initialized vitality for {ch.name}: "
-                   f"HP {vit_aux.max_hp:.0f}, SP {vit_aux.max_sp:.0f}, EP {vit_aux.max_ep:.0f}")
+    if LOG_RECALCULATIONS:
+        mud.log_string(f"Initialized vitality for {ch.name}: "
+                       f"HP {vit_aux.max_hp:.0f}, SP {vit_aux.max_sp:.0f}, EP {vit_aux.max_ep:.0f}")
 
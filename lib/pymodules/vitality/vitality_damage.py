@@ -4,9 +4,30 @@ Vitality Damage System
 Handles damage application and death detection with hook support.
 """
 
+import weakref
 import mud
 import hooks
 
+# Log every damage and heal application (noisy in combat)
+LOG_DAMAGE = False
+
+# Servers built before hooks.has_listeners existed: assume someone listens
+_has_listeners = getattr(hooks, "has_listeners", lambda hook_type: True)
+
+# ch.uid -> vitality aux. Entries vanish with the aux when the character is freed.
+_VIT_CACHE = weakref.WeakValueDictionary()
+
+
+def _get_vit(ch):
+    """Get a character's vitality aux, remembering it for later calls."""
+    uid = ch.uid
+    vit_aux = _VIT_CACHE.get(uid)
+    if vit_aux is None:
+        vit_aux = ch.getAuxiliary("vitality_data")
+        if vit_aux is not None:
+            _VIT_CACHE[uid] = vit_aux
+    return vit_aux
+
 
 def take_damage(ch, amount, damage_type="physical", source=None):
     """
@@ -21,7 +42,7 @@ def take_damage(ch, amount, damage_type="physical", source=None):
     Returns:
         bool: True if damage was applied, False if character has no vitality data
     """
-    vit_aux = ch.getAuxiliary("vitality_data")
+    vit_aux = _get_vit(ch)
     if not vit_aux:
         mud.log_string("take_damage: %s has no vitality data" % ch.name)
         return False
@@ -33,14 +54,16 @@ def take_damage(ch, amount, damage_type="physical", source=None):
     old_hp = vit_aux.hp
     vit_aux.hp = max(0, vit_aux.hp - amount)
     
-    mud.log_string("DAMAGE: %s took %.1f %s damage (%.1f -> %.1f HP)" % 
-                   (ch.name, amount, damage_type, old_hp, vit_aux.hp))
+    if LOG_DAMAGE:
+        mud.log_string("DAMAGE: %s took %.1f %s damage (%.1f -> %.1f HP)" % 
+                       (ch.name, amount, damage_type, old_hp, vit_aux.hp))
     
     # Fire damage hook for combat effects, spells, etc.
     # Systems can listen to this to apply damage reduction, shields, etc.
-    damage_info = hooks.build_info("ch int str ch", 
-                                    (ch, amount, damage_type, source))
-    hooks.run("on_damage", damage_info)
+    if _has_listeners("on_damage"):
+        damage_info = hooks.build_info("ch int str ch", 
+                                        (ch, amount, damage_type, source))
+        hooks.run("on_damage", damage_info)
     
     # Check for death - only trigger if we just died (wasn't already at 0)
     if vit_aux.hp <= 0 and old_hp > 0:
@@ -48,9 +71,10 @@ def take_damage(ch, amount, damage_type="physical", source=None):
         mud.log_string("DEATH: %s has died from %s damage" % (ch.name, damage_type))
         
         # Fire death hook - death handler will process this
-        death_info = hooks.build_info("ch ch str", 
-                                      (ch, source, damage_type))
-        hooks.run("on_death", death_info)
+        if _has_listeners("on_death"):
+            death_info = hooks.build_info("ch ch str", 
+                                          (ch, source, damage_type))
+            hooks.run("on_death", death_info)
     
     return True
 
@@ -67,7 +91,7 @@ def heal_damage(ch, amount, heal_type="healing"):
     Returns:
         bool: True if healing was applied
     """
-    vit_aux = ch.getAuxiliary("vitality_data")
+    vit_aux = _get_vit(ch)
     if not vit_aux:
         return False
     
@@ -79,7 +103,7 @@ def heal_damage(ch, amount, heal_type="healing"):
     vit_aux.hp = min(vit_aux.max_hp, vit_aux.hp + amount)
     
     actual_healed = vit_aux.hp - old_hp
-    if actual_healed > 0:
+    if LOG_DAMAGE and actual_healed > 0:
         mud.log_string("HEAL: %s healed %.1f HP (%.1f -> %.1f)" % 
                        (ch.name, actual_healed, old_hp, vit_aux.hp))
     
@@ -88,7 +112,7 @@ def heal_damage(ch, amount, heal_type="healing"):
 
 def is_dead(ch):
     """Check if a character is dead."""
-    vit_aux = ch.getAuxiliary("vitality_data")
+    vit_aux = _get_vit(ch)
     if not vit_aux:
         return False
     return vit_aux.is_dead
@@ -96,7 +120,7 @@ def is_dead(ch):
 
 def get_hp_percentage(ch):
     """Get character's HP as a percentage (0-100)."""
-    vit_aux = ch.getAuxiliary("vitality_data")
+    vit_aux = _get_vit(ch)
     if not vit_aux or vit_aux.max_hp <= 0:
         return 100.0
     return (vit_aux.hp / vit_aux.max_hp) * 100.0
@@ -127,7 +127,7 @@ def apply_wound(ch, body_part=None, wound_type="surface", severity=3):
             return False
         body_part = random.choice(valid_parts)
     
-    body_part = body_part.lower()
+    body_part = injury_penalties.canon(body_part)
     
     # Initialize wounds dict if needed
     if not hasattr(injury_aux, 'wounds'):
@@ -167,7 +167,7 @@ def add_wound_status(ch, body_part, status):
     if not injury_aux or not hasattr(injury_aux, 'wounds'):
         return False
     
-    body_part = body_part.lower()
+    body_part = injury_penalties.canon(body_part)
     if body_part not in injury_aux.wounds:
         return False
     
@@ -198,7 +198,7 @@ def get_wounds(ch, body_part=None):
     if body_part is None:
         return injury_aux.wounds
     
-    return injury_aux.wounds.get(body_part.lower(), None)
+    return injury_aux.wounds.get(injury_penalties.canon(body_part), None)
 
 
 def get_severity_name(severity):
@@ -291,21 +291,13 @@ def get_scar_penalties(ch):
         ch: Character
     
     Returns:
-        dict: Skill -> penalty mapping
+        dict: Skill -> penalty mapping (cached on the aux, do not modify)
     """
-    penalties = {}
-    
     injury_aux = ch.getAuxiliary("injury_data")
     if not injury_aux or not hasattr(injury_aux, 'scars'):
-        return penalties
-    
-    # Iterate through scars and accumulate penalties
-    for body_part, scar_severity in injury_aux.scars.items():
-        part_penalties = injury_penalties.get_penalties(body_part, scar_severity)
-        for skill, penalty in part_penalties.items():
-            penalties[skill] = penalties.get(skill, 0) + penalty
+        return {}
     
-    return penalties
+    return injury_aux.total_penalties()
 
 def setup_injuries(ch):
     """
@@ -424,18 +416,7 @@ def get_vitality_percent(ch, vitality_type="hp"):
     Returns:
         float: Percentage (0.0 to 100.0)
     """
-    vit_aux = get_vitality(ch)
-    if not vit_aux:
-        return 100.0
-    
-    if vitality_type == "hp":
-        return (vit_aux.hp / vit_aux.max_hp * 100.0) if vit_aux.max_hp > 0 else 0.0
-    elif vitality_type == "sp":
-        return (vit_aux.sp / vit_aux.max_sp * 100.0) if vit_aux.max_sp > 0 else 0.0
-    elif vitality_type == "ep":
-        return (vit_aux.ep / vit_aux.max_ep * 100.0) if vit_aux.max_ep > 0 else 0.0
-    
-    return 0.0
+    return vitality_core.get_vitality_percent(ch, vitality_type)
 
 
 def get_vitality_color(percent):
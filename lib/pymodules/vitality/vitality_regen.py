@@ -131,6 +131,41 @@ def calculate_ep_regen_rate(ch):
         return 1.0
 
 
+def calculate_regen_rates(ch):
+    """
+    Calculate HP, SP, and EP regeneration per tick in one pass.
+    Same formulas as the calculate_*_regen_rate functions, but the
+    attribute data is looked up once.
+    
+    Args:
+        ch: Character object
+    
+    Returns:
+        tuple: (hp_regen, sp_regen, ep_regen)
+    """
+    if not MODULES_AVAILABLE:
+        return (1.0, 1.0, 1.0)
+    
+    try:
+        attr_aux = attribute_aux.get_attributes(ch)
+        if not attr_aux:
+            return (1.0, 1.0, 1.0)
+        
+        get_attribute = attr_aux.get_attribute
+        stamina = get_attribute("stamina")
+        discipline = get_attribute("discipline")
+        intelligence = get_attribute("intelligence")
+        wisdom = get_attribute("wisdom")
+        
+        return (max(0.1, (stamina * 0.1) + (discipline * 0.05)),
+                max(0.1, (intelligence * 0.15) + (wisdom * 0.1)),
+                max(0.1, (stamina * 0.12) + (discipline * 0.08)))
+    except:
+        return (calculate_hp_regen_rate(ch),
+                calculate_sp_regen_rate(ch),
+                calculate_ep_regen_rate(ch))
+
+
 def get_position_modifier(ch):
     """
     Get the regeneration modifier based on character position.
@@ -175,13 +210,17 @@ def regenerate_vitality(ch):
         if vit_aux.is_dead:
             return
         
-        # Get position modifier
-        position_mod = get_position_modifier(ch)
+        # Get position modifier (already known not to be dead)
+        try:
+            position_mod = POSITION_MODIFIERS.get(ch.pos.lower(), POSITION_MODIFIERS["standing"])
+        except:
+            position_mod = POSITION_MODIFIERS["standing"]
         
         # Calculate regeneration amounts
-        hp_regen = calculate_hp_regen_rate(ch) * position_mod
-        sp_regen = calculate_sp_regen_rate(ch) * position_mod
-        ep_regen = calculate_ep_regen_rate(ch) * position_mod
+        hp_rate, sp_rate, ep_rate = calculate_regen_rates(ch)
+        hp_regen = hp_rate * position_mod
+        sp_regen = sp_rate * position_mod
+        ep_regen = ep_rate * position_mod
         
         # Apply regeneration
         old_hp = vit_aux.hp
@@ -236,12 +275,7 @@ def regenerate_all_characters():
         if len(char_list) == 0:
             return
         
-        for idx in range(len(char_list)):
-            try:
-                ch = char_list[idx]
-            except:
-                continue
-            
+        for ch in char_list:
             if ch is None:
                 continue
             
@@ -308,9 +342,7 @@ def show_regen_info(ch):
         return "Regeneration system not available."
     
     try:
-        hp_rate = calculate_hp_regen_rate(ch)
-        sp_rate = calculate_sp_regen_rate(ch)
-        ep_rate = calculate_ep_regen_rate(ch)
+        hp_rate, sp_rate, ep_rate = calculate_regen_rates(ch)
         
         pos_mod = get_position_modifier(ch)
         position = ch.pos.lower()
@@ -68,6 +68,11 @@ void hookAdd(const char *type, void (* func)(const char *)) {
   listQueue(list, func);
 }
 
+bool hookHasListeners(const char *type) {
+  LIST *list = hashGet(hook_table, type);
+  return (list != NULL && !isListEmpty(list));
+}
+
 void hookAddMonitor(void (* func)(const char *, const char *)) {
   listQueue(monitors, func);
 }
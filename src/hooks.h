@@ -35,6 +35,11 @@ void hookRun(const char *type, const char *info);
 void hookAdd(const char *type, void (* func)(const char *));
 void hookAddMonitor(void (* func)(const char *, const char *));
 void hookRemove(const char *type, void (* func)(const char *));
+
+//
+// returns TRUE if any C function is registered to the given hook type. Hook
+// monitors are not counted
+bool hookHasListeners(const char *type);
 void hookParseInfo(const char *info, ...);
 const char *hookBuildInfo(const char *format, ...);
 LIST *parse_hook_info_tokens(const char *info);
@@ -311,6 +311,20 @@ PyObject *PyHooks_Remove(PyObject *self, PyObject *args) {
 }
 
 
+PyObject *PyHooks_HasListeners(PyObject *self, PyObject *args) {
+  char *type = NULL;
+  if(!PyArg_ParseTuple(args, "s", &type)) {
+    PyErr_Format(PyExc_TypeError, "A hook type must be supplied");
+    return NULL;
+  }
+
+  LIST *list = hashGet(pyhook_table, type);
+  if((list != NULL && !isListEmpty(list)) || hookHasListeners(type))
+    Py_RETURN_TRUE;
+  Py_RETURN_FALSE;
+}
+
+
 //
 // monitors hook activity, and handles the ones on the Python end
 void PyHooks_Monitor(const char *type, const char *info) {
@@ -371,6 +385,10 @@ PyInit_PyHooks(void) {
   PyHooks_addMethod("remove", PyHooks_Remove, METH_VARARGS,
     "remove(type, function)\n\n"
     "Unregister a hook function.");
+  PyHooks_addMethod("has_listeners", PyHooks_HasListeners, METH_VARARGS,
+    "has_listeners(type)\n\n"
+    "Returns True if any C or Python function is registered to the hook type.\n"
+    "Use it to skip building hook info when nothing would receive it.");
 
 
   hooks_moduledef.m_methods = makePyMethods(pyhooks_methods);